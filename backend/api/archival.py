@@ -0,0 +1,50 @@
+from django.utils import timezone
+
+from .cache import invalidate
+from .models import Notice, Tender
+
+
+def expired_notices(now):
+    return Notice.objects.filter(status='Published', expiry_date__lte=now)
+
+
+def closed_tenders(now):
+    return Tender.objects.filter(is_closed=False, submission_deadline__lte=now)
+
+
+def update_rows(queryset, batch_size=None, **values):
+    """
+    Apply `values` to every row of `queryset` with UPDATE statements, touching at most
+    `batch_size` rows per statement when given. The filter must stop matching a row once
+    it is updated, so each statement picks up where the last one stopped.
+    """
+    if not batch_size:
+        return queryset.update(**values)
+    total = 0
+    while True:
+        updated = queryset.model.objects.filter(pk__in=queryset.values('pk')[:batch_size]).update(**values)
+        total += updated
+        if updated < batch_size:
+            return total
+
+
+def archive_expired(now=None, batch_size=None, dry_run=False):
+    """
+    Move published notices past their expiry date to Archived and flag tenders past
+    their submission deadline as closed. Returns the number of rows per model.
+    """
+    now = now or timezone.now()
+    if dry_run:
+        return {'notices': expired_notices(now).count(), 'tenders': closed_tenders(now).count()}
+
+    counts = {
+        'notices': update_rows(expired_notices(now), batch_size, status='Archived', updated_at=now),
+        'tenders': update_rows(closed_tenders(now), batch_size, is_closed=True, updated_at=now),
+    }
+    # update() sends no signals. Archived notices stay searchable and neither change
+    # touches indexed text, so only the response cache needs a new generation.
+    if counts['notices']:
+        invalidate(Notice)
+    if counts['tenders']:
+        invalidate(Tender)
+    return counts
@@ -0,0 +1,128 @@
+import hashlib
+
+from django.db.models import Count, Max
+from django.http import HttpResponse
+from django.urls import path
+from django.views import View
+from rest_framework.exceptions import ValidationError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from . import views
+from .cache import aget_versions, get_cache, get_timeout, model_key, time_bucket
+from .fieldsets import narrow_queryset
+
+
+def json_response(data, status=200):
+    return HttpResponse(JSONRenderer().render(data), status=status, content_type='application/json')
+
+
+class AsyncPublicReadView(View):
+    """
+    Async `list` and `retrieve` for one of the public viewsets, reusing its queryset,
+    filter backends and (summary) serializers, so the JSON matches the synchronous endpoint. Rows
+    come from the async ORM and responses from the shared response cache, so under an
+    ASGI server a request waiting on the database or cache does not hold a thread.
+
+    Lists are bounded: `?limit=` (default PAGE_SIZE, at most `max_limit`) rows in the
+    viewset's `cursor_ordering` unless `?ordering=` is given.
+    """
+    viewset = None
+    max_limit = 100
+    http_method_names = ['get', 'head', 'options']
+
+    async def get(self, request, pk=None):
+        model = self.viewset.queryset.model
+        try:
+            queryset = self.get_queryset(request, pk)
+        except ValidationError as exc:
+            return json_response(exc.detail, status=400)
+        # The same key material as the synchronous endpoint: generations, the time bucket
+        # and the newest `updated_at` and row count of the filtered rows.
+        versions = await aget_versions(getattr(self.viewset, 'cache_models', None) or (model,))
+        bucket = time_bucket(request.GET, self.viewset.time_relative_params, self.viewset.time_bucket)
+        fingerprint = await self.get_fingerprint(queryset)
+        digest = hashlib.md5(f'{request.get_full_path()}{bucket}:{fingerprint}'.encode()).hexdigest()
+        key = f"async-response:{model_key(model)}:{'.'.join(map(str, versions))}:{digest}"
+
+        cache = get_cache()
+        body = await cache.aget(key)
+        if body is not None:
+            response = HttpResponse(body, content_type='application/json')
+            response['X-Cache'] = 'HIT'
+            return response
+
+        try:
+            data = await (self.list(request, queryset) if pk is None else self.retrieve(queryset))
+        except ValidationError as exc:
+            return json_response(exc.detail, status=400)
+        if data is None:
+            return json_response({'detail': 'No %s matches the given query.' % model._meta.object_name}, status=404)
+
+        response = json_response(data)
+        await cache.aset(key, response.content, get_timeout())
+        response['X-Cache'] = 'MISS'
+        return response
+
+    def get_queryset(self, request, pk=None):
+        if pk is not None:
+            return self.viewset.queryset.filter(pk=pk)
+        # The filter backends only read query parameters and view attributes, so they
+        # are safe to run on the event loop; the queryset is evaluated later.
+        drf_request = Request(request)
+        view = self.viewset(request=drf_request, format_kwarg=None, action='list')
+        queryset = self.viewset.queryset.all()
+        for backend in view.filter_backends:
+            queryset = backend().filter_queryset(drf_request, queryset, view)
+        return queryset
+
+    async def get_fingerprint(self, queryset):
+        """The fingerprint half of `ConditionalGetMixin.get_validators`, read with the async ORM."""
+        stats = await queryset.order_by().aaggregate(
+            last_modified=Max(self.viewset.last_modified_field),
+            count=Count('pk'),
+        )
+        return f"{stats['last_modified']}|{stats['count']}"
+
+    async def list(self, request, queryset):
+        try:
+            limit = int(request.GET.get('limit', api_settings.PAGE_SIZE))
+        except ValueError:
+            raise ValidationError({'limit': 'Must be an integer.'})
+        limit = min(max(limit, 1), self.max_limit)
+
+        if not queryset.ordered:
+            queryset = queryset.order_by(*getattr(self.viewset, 'cursor_ordering', ('-pk',)))
+
+        serializer_class = self.viewset.summary_serializer_class or self.viewset.serializer_class
+        queryset = narrow_queryset(queryset, serializer_class(), list(serializer_class().fields))
+        rows = [row async for row in queryset[:limit]]
+        return serializer_class(rows, many=True).data
+
+    async def retrieve(self, queryset):
+        instance = await queryset.afirst()
+        if instance is None:
+            return None
+        return self.viewset.serializer_class(instance).data
+
+
+PUBLIC_VIEWSETS = {
+    'notices': views.NoticeViewSet,
+    'tenders': views.TenderViewSet,
+    'news-events': views.NewsAndEventsViewSet,
+    'gallery': views.GalleryViewSet,
+    'documents': views.DocumentsViewSet,
+    'schemes-projects': views.SchemesAndProjectsViewSet,
+}
+
+
+def async_urlpatterns():
+    patterns = []
+    for prefix, viewset in PUBLIC_VIEWSETS.items():
+        view = AsyncPublicReadView.as_view(viewset=viewset)
+        patterns += [
+            path(f'async/{prefix}/', view, name=f'async-{prefix}-list'),
+            path(f'async/{prefix}/<int:pk>/', view, name=f'async-{prefix}-detail'),
+        ]
+    return patterns
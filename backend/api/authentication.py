@@ -0,0 +1,182 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import exceptions, permissions
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+from .cache import get_cache
+
+
+def token_ttl():
+    return timedelta(seconds=getattr(settings, 'AUTH_TOKEN_TTL', 12 * 60 * 60))
+
+
+def token_expires_at(token):
+    return token.created + token_ttl()
+
+
+def issue_token(user):
+    """
+    Return the user's token, replacing it with a fresh one once it has used up half of
+    its lifetime, so active admins rotate keys without being logged out mid-session.
+    """
+    token = Token.objects.filter(user=user).first()
+    if token is not None and timezone.now() < token.created + token_ttl() / 2:
+        return token
+    return rotate_token(user)
+
+
+def rotate_token(user):
+    Token.objects.filter(user=user).delete()
+    return Token.objects.create(user=user)
+
+
+def _generation_key(user_id):
+    return f'auth-generation:{user_id}'
+
+
+def get_generation(user_id):
+    cache = get_cache()
+    key = _generation_key(user_id)
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        generation = cache.get(key)
+    return generation
+
+
+def revoke_cached_tokens(user_id):
+    """
+    Bump the user's generation so cached authentication for them is dropped on the next
+    request. Processes see the bump through the response cache: with a shared backend
+    (Redis, Memcached) that is every process at once; with the default per-process
+    LocMemCache only this one. Writes re-check the token row anyway, so other processes
+    can only keep serving reads on a cached entry, for up to AUTH_TOKEN_CACHE_TTL seconds.
+    """
+    cache = get_cache()
+    key = _generation_key(user_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), timeout=None)
+
+
+class TokenCache:
+    """A small thread-safe LRU of token key -> (token, cached_at, generation)."""
+
+    def __init__(self, max_size, ttl):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[1] > self.ttl:
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return entry
+
+    def set(self, key, token, generation):
+        with self.lock:
+            self.entries[key] = (token, time.monotonic(), generation)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def discard(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+token_cache = TokenCache(
+    max_size=getattr(settings, 'AUTH_TOKEN_CACHE_SIZE', 1024),
+    ttl=getattr(settings, 'AUTH_TOKEN_CACHE_TTL', 60),
+)
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication with expiring tokens and an in-process cache of recent lookups,
+    so bursts of admin requests skip the token/user join. A cached entry is trusted for
+    AUTH_TOKEN_CACHE_TTL seconds at most, and is dropped once the user's generation
+    changes: on logout, on token rotation, or on any save of the user such as deactivation.
+    Other processes only see that change at once through a shared cache (see
+    `revoke_cached_tokens`), so unsafe methods also confirm the token row still exists
+    for an active user before trusting a cached entry. A revoked token can keep reading
+    for up to the TTL in another process, but never write.
+    """
+
+    def authenticate(self, request):
+        # Authenticators are instantiated per request, so this is safe to keep on self.
+        self.verify_cached = request.method not in permissions.SAFE_METHODS
+        return super().authenticate(request)
+
+    def authenticate_credentials(self, key):
+        entry = token_cache.get(key)
+        if entry is not None:
+            token, cached_at, generation = entry
+            trusted = generation == get_generation(token.user_id) and timezone.now() < token_expires_at(token)
+            if trusted and getattr(self, 'verify_cached', False):
+                trusted = Token.objects.filter(key=key, user__is_active=True).exists()
+            if trusted:
+                # Each request gets its own copy of the user, so nothing a request sets on
+                # it leaks to concurrent requests sharing the cache entry.
+                return copy.copy(token.user), token
+            token_cache.discard(key)
+
+        try:
+            token = Token.objects.select_related('user').get(key=key)
+        except Token.DoesNotExist:
+            raise exceptions.AuthenticationFailed('Invalid token.')
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed('User inactive or deleted.')
+        if timezone.now() >= token_expires_at(token):
+            token.delete()
+            raise exceptions.AuthenticationFailed('Token has expired.')
+
+        token_cache.set(key, token, get_generation(token.user_id))
+        return copy.copy(token.user), token
+
+
+class AuthenticationStrategyMixin:
+    """
+    Lets a viewset name the actions it serves anonymously (`anonymous_actions`). Those
+    run with no authenticators at all, so public reads never touch the token cache, the
+    session store or a password hasher, and `request.user` is always AnonymousUser there.
+    With AUTH_SERVER_TIMING on, responses report the time spent authenticating.
+    """
+    anonymous_actions = []
+
+    def get_authenticators(self):
+        # Runs before `self.action` is set, so resolve the action from the method.
+        action = getattr(self, 'action_map', {}).get(self.request.method.lower())
+        if action in self.anonymous_actions:
+            return []
+        return super().get_authenticators()
+
+    def perform_authentication(self, request):
+        started = time.perf_counter()
+        super().perform_authentication(request)
+        self.authentication_time = time.perf_counter() - started
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if getattr(settings, 'AUTH_SERVER_TIMING', False) and hasattr(self, 'authentication_time'):
+            authenticators = ','.join(type(item).__name__ for item in request.authenticators) or 'none'
+            response['Server-Timing'] = f'auth;dur={self.authentication_time * 1000:.3f};desc="{authenticators}"'
+        return response
@@ -0,0 +1,157 @@
+from django.db import connections, router, transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from . import search
+from .cache import invalidate
+
+
+def delete_rows(model, pks):
+    """
+    A single `DELETE ... WHERE pk IN (...)` when no other table references the model, so
+    no rows are loaded and no per-row signals run; otherwise Django's collector, so
+    cascades and SET_NULL still apply.
+    """
+    if model._meta.related_objects:
+        return model.objects.filter(pk__in=pks).delete()[0]
+    connection = connections[router.db_for_write(model)]
+    quote = connection.ops.quote_name
+    placeholders = ', '.join(['%s'] * len(pks))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'DELETE FROM {quote(model._meta.db_table)} WHERE {quote(model._meta.pk.column)} IN ({placeholders})',
+            list(pks),
+        )
+        return cursor.rowcount
+
+
+class BulkActionsMixin:
+    """
+    `POST bulk/` creates a list of rows, `PATCH bulk/` applies a list of partial updates
+    (each naming its primary key) and `DELETE bulk/` deletes `{"ids": [...]}`. Every item
+    is validated before anything is written: if any fails, the response lists the errors
+    by item index and nothing changes. A valid batch is written in one transaction with
+    one bulk_create, bulk_update or DELETE. Bulk writes skip model signals, so the
+    response cache and search index are brought up to date here instead.
+    """
+    bulk_max_items = 500
+    bulk_owner_field = None
+
+    def get_bulk_items(self, data):
+        if not isinstance(data, list) or not data:
+            raise ValidationError({'detail': 'Expected a non-empty list of items.'})
+        if len(data) > self.bulk_max_items:
+            raise ValidationError({'detail': f'At most {self.bulk_max_items} items per request.'})
+        return data
+
+    def get_bulk_ids(self, ids):
+        if not all(isinstance(pk, int) and not isinstance(pk, bool) for pk in ids):
+            raise ValidationError({'ids': 'Expected a list of integer ids.'})
+        return ids
+
+    def get_bulk_attrs(self, validated_data, instance=None):
+        """Model attributes for one validated item; raise ValidationError to reject it."""
+        attrs = dict(validated_data)
+        if instance is None and self.bulk_owner_field:
+            attrs[self.bulk_owner_field] = self.request.user
+        return attrs
+
+    def bulk_error_response(self, errors):
+        return Response({'errors': errors}, status=status.HTTP_400_BAD_REQUEST)
+
+    def bulk_written(self, instances):
+        model = self.queryset.model
+        invalidate(model)
+        if model in search.SOURCES_BY_MODEL:
+            search.index_instances(model, instances)
+
+    def bulk_deleted(self, instances):
+        model = self.queryset.model
+        invalidate(model)
+        if model in search.SOURCES_BY_MODEL:
+            search.remove_instances(model, [instance.pk for instance in instances])
+
+    @action(detail=False, methods=['post'], url_path='bulk', url_name='bulk')
+    def bulk_create(self, request):
+        model = self.queryset.model
+        instances, errors = [], []
+        for index, item in enumerate(self.get_bulk_items(request.data)):
+            serializer = self.get_serializer(data=item)
+            try:
+                serializer.is_valid(raise_exception=True)
+                instances.append(model(**self.get_bulk_attrs(serializer.validated_data)))
+            except ValidationError as exc:
+                errors.append({'index': index, 'errors': exc.detail})
+        if errors:
+            return self.bulk_error_response(errors)
+
+        with transaction.atomic():
+            instances = model.objects.bulk_create(instances)
+            self.bulk_written(instances)
+        return Response(self.get_serializer(instances, many=True).data, status=status.HTTP_201_CREATED)
+
+    @bulk_create.mapping.patch
+    def bulk_update(self, request):
+        model = self.queryset.model
+        pk_name = model._meta.pk.name
+        items = self.get_bulk_items(request.data)
+        ids = [item.get(pk_name) if isinstance(item, dict) else None for item in items]
+        existing = self.get_queryset().in_bulk([pk for pk in ids if isinstance(pk, int)])
+
+        instances, fields, errors, seen = [], set(), [], set()
+        for index, (item, pk) in enumerate(zip(items, ids)):
+            instance = existing.get(pk) if isinstance(pk, int) else None
+            if instance is None or pk in seen:
+                if pk is None:
+                    reason = 'This field is required.'
+                else:
+                    reason = 'Duplicate item.' if pk in seen else 'Not found.'
+                errors.append({'index': index, 'errors': {pk_name: [reason]}})
+                continue
+            seen.add(pk)
+            serializer = self.get_serializer(instance, data=item, partial=True)
+            try:
+                serializer.is_valid(raise_exception=True)
+                attrs = self.get_bulk_attrs(serializer.validated_data, instance)
+            except ValidationError as exc:
+                errors.append({'index': index, 'errors': exc.detail})
+                continue
+            for name, value in attrs.items():
+                setattr(instance, name, value)
+            fields.update(attrs)
+            instances.append(instance)
+        if errors:
+            return self.bulk_error_response(errors)
+
+        # bulk_update() does not run pre_save, so stamp auto_now fields here.
+        now = timezone.now()
+        for field in model._meta.concrete_fields:
+            if getattr(field, 'auto_now', False):
+                for instance in instances:
+                    setattr(instance, field.attname, now)
+                fields.add(field.name)
+        with transaction.atomic():
+            model.objects.bulk_update(instances, sorted(fields))
+            self.bulk_written(instances)
+        return Response(self.get_serializer(instances, many=True).data, status=status.HTTP_200_OK)
+
+    @bulk_create.mapping.delete
+    def bulk_destroy(self, request):
+        ids = request.data.get('ids') if isinstance(request.data, dict) else None
+        ids = self.get_bulk_ids(self.get_bulk_items(ids))
+        existing = self.get_queryset().in_bulk(ids)
+        errors = [
+            {'index': index, 'errors': {'ids': ['Not found.']}}
+            for index, pk in enumerate(ids) if pk not in existing
+        ]
+        if errors:
+            return self.bulk_error_response(errors)
+
+        instances = list(existing.values())
+        with transaction.atomic():
+            deleted = delete_rows(self.queryset.model, list(existing))
+            self.bulk_deleted(instances)
+        return Response({'deleted': deleted}, status=status.HTTP_200_OK)
@@ -0,0 +1,181 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.http import quote_etag
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+
+def get_cache():
+    return caches[getattr(settings, 'RESPONSE_CACHE_ALIAS', 'default')]
+
+
+def get_timeout():
+    return getattr(settings, 'RESPONSE_CACHE_TIMEOUT', 300)
+
+
+def model_key(model):
+    return model._meta.label_lower
+
+
+def _version_key(model):
+    return f'response-version:{model_key(model)}'
+
+
+def get_versions(models):
+    """
+    Current cache generation of each model. Generations start at a timestamp rather
+    than 1 so that an evicted counter can never fall back to a value already in use.
+    """
+    cache = get_cache()
+    keys = [_version_key(model) for model in models]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, time.time_ns(), timeout=None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+async def aget_versions(models):
+    """`get_versions` for async views, through the cache's async API."""
+    cache = get_cache()
+    keys = [_version_key(model) for model in models]
+    versions = await cache.aget_many(keys)
+    for key in keys:
+        if key not in versions:
+            await cache.aadd(key, time.time_ns(), timeout=None)
+            versions[key] = await cache.aget(key)
+    return [versions[key] for key in keys]
+
+
+def invalidate(*models):
+    """Drop every cached response that rendered rows of the given models."""
+    cache = get_cache()
+    for model in models:
+        key = _version_key(model)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), timeout=None)
+
+
+def content_etag(data, *parts):
+    """A strong ETag for `data` as it is sent, plus any `parts` that vary the representation."""
+    digest = hashlib.md5(':'.join(parts).encode())
+    digest.update(JSONRenderer().render(data))
+    return quote_etag(digest.hexdigest())
+
+
+def time_slot(seconds):
+    """The current `seconds`-long time slot as key material."""
+    return f':t{int(time.time() // seconds)}'
+
+
+def time_bucket(query_params, names, seconds):
+    """`time_slot` when any of `names` is set."""
+    if any(query_params.get(name) for name in names):
+        return time_slot(seconds)
+    return ''
+
+
+def _record(resource, outcome):
+    cache = get_cache()
+    key = f'response-stats:{resource}:{outcome}'
+    if not cache.add(key, 1, timeout=None):
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, timeout=None)
+
+
+def get_stats():
+    cache = get_cache()
+    stats = {}
+    for resource in sorted(CachedResponseMixin.resources):
+        hits = cache.get(f'response-stats:{resource}:hit', 0)
+        misses = cache.get(f'response-stats:{resource}:miss', 0)
+        total = hits + misses
+        stats[resource] = {
+            'hits': hits,
+            'misses': misses,
+            'hit_ratio': round(hits / total, 4) if total else None,
+        }
+    return stats
+
+
+def reset_stats():
+    get_cache().delete_many([
+        f'response-stats:{resource}:{outcome}'
+        for resource in CachedResponseMixin.resources
+        for outcome in ('hit', 'miss')
+    ])
+
+
+class CachedResponseMixin:
+    """
+    Caches the `list` and `retrieve` responses of a viewset, keyed on the absolute URL,
+    the negotiated format and the cache generation of every model in `cache_models`.
+    Saving or deleting any of those models bumps its generation (see `signals.py`),
+    which makes all dependent entries unreachable at once. Generations live in the
+    response cache, so other processes only see a bump through a shared cache; with
+    the per-process LocMemCache they serve their copy until RESPONSE_CACHE_TIMEOUT.
+
+    The ETag of the body is stored with it, so it always describes what is sent.
+    Filters relative to the current time (`time_relative_params`) add a `time_bucket`
+    second slot to the key, so rows that expire without a write drop out that soon.
+    """
+    cache_models = None
+    time_relative_params = ('active',)
+    time_bucket = 60
+    resources = set()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if getattr(cls, 'queryset', None) is not None:
+            CachedResponseMixin.resources.add(model_key(cls.queryset.model))
+
+    def get_cache_models(self):
+        return self.cache_models or (self.queryset.model,)
+
+    def get_cache_variant(self, request):
+        """Extra key material; ConditionalGetMixin adds the queryset's validators."""
+        return time_bucket(request.query_params, self.time_relative_params, self.time_bucket)
+
+    def get_cache_key(self, request):
+        models = self.get_cache_models()
+        versions = '.'.join(str(version) for version in get_versions(models))
+        url = request.build_absolute_uri()
+        variant = self.get_cache_variant(request)
+        digest = hashlib.md5(f'{request.accepted_renderer.format}:{url}:{variant}'.encode()).hexdigest()
+        return f'response:{model_key(self.queryset.model)}:{versions}:{digest}'
+
+    def cached_response(self, request, handler, *args, **kwargs):
+        resource = model_key(self.queryset.model)
+        cache = get_cache()
+        key = self.get_cache_key(request)
+        cached = cache.get(key)
+        if cached is not None:
+            _record(resource, 'hit')
+            data, status_code, etag = cached
+            response = Response(data, status=status_code)
+            response['ETag'] = etag
+            response['X-Cache'] = 'HIT'
+            return response
+
+        _record(resource, 'miss')
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            etag = content_etag(response.data, request.accepted_renderer.format)
+            cache.set(key, (response.data, response.status_code, etag), get_timeout())
+            response['ETag'] = etag
+        response['X-Cache'] = 'MISS'
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(request, super().retrieve, *args, **kwargs)
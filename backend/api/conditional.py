@@ -0,0 +1,87 @@
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
+from django.http import Http404
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, parse_http_date_safe, parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+
+from .cache import content_etag
+
+
+class ConditionalGetMixin:
+    """
+    Answers `If-None-Match` on `list` and `retrieve` with a 304. The ETag is the hash of
+    the body as sent, which the response cache stores alongside it, so a cache hit is
+    answered without serializing anything. The newest `updated_at` and row count of the
+    filtered queryset go into the cache key, so writes from any process, deletes and
+    rows leaving a filter all lead to a fresh body. That costs one aggregate query per
+    request, and a cache miss serializes the body before it can be compared.
+
+    `If-Modified-Since` is only honoured on `retrieve` when nothing but the row itself
+    is rendered: a list also changes on deletes, and a related row such as the user in
+    `created_by` changes without touching `updated_at`.
+    """
+    last_modified_field = 'updated_at'
+
+    def get_validator_queryset(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        if lookup_url_kwarg in self.kwargs:
+            # A malformed key is a 404, as get_object_or_404 treats it.
+            try:
+                queryset = queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+            except (TypeError, ValueError, ValidationError):
+                raise Http404
+        return queryset
+
+    def get_validators(self, request):
+        """`(fingerprint, last_modified)` of the filtered queryset, read once per request."""
+        if not hasattr(self, '_validators'):
+            stats = self.get_validator_queryset().order_by().aggregate(
+                last_modified=Max(self.last_modified_field),
+                count=Count('pk'),
+            )
+            self._validators = (f"{stats['last_modified']}|{stats['count']}", stats['last_modified'])
+        return self._validators
+
+    def get_cache_variant(self, request):
+        return f'{super().get_cache_variant(request)}:{self.get_validators(request)[0]}'
+
+    def uses_last_modified(self):
+        related = [model for model in getattr(self, 'cache_models', None) or () if model is not self.queryset.model]
+        return self.detail and not related
+
+    def is_not_modified(self, request, etag, last_modified):
+        if_none_match = request.headers.get('If-None-Match')
+        if if_none_match:
+            etags = [tag.removeprefix('W/') for tag in parse_etags(if_none_match)]
+            return '*' in etags or etag in etags
+        if_modified_since = parse_http_date_safe(request.headers.get('If-Modified-Since') or '')
+        if if_modified_since is not None and last_modified is not None:
+            return int(last_modified.timestamp()) <= if_modified_since
+        return False
+
+    def conditional_response(self, request, handler, *args, **kwargs):
+        response = handler(request, *args, **kwargs)
+        if response.status_code != status.HTTP_200_OK:
+            return response
+        etag = response.get('ETag') or content_etag(response.data, request.accepted_renderer.format)
+        last_modified = self.get_validators(request)[1] if self.uses_last_modified() else None
+        if self.is_not_modified(request, etag, last_modified):
+            not_modified = Response(status=status.HTTP_304_NOT_MODIFIED)
+            if 'X-Cache' in response:
+                not_modified['X-Cache'] = response['X-Cache']
+            response = not_modified
+        response['ETag'] = etag
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified.timestamp())
+        patch_cache_control(response, no_cache=True)
+        patch_vary_headers(response, ['Accept'])
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_response(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(request, super().retrieve, *args, **kwargs)
@@ -0,0 +1,121 @@
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+from rest_framework.decorators import action
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+CHUNK_SIZE = 64 * 1024
+
+
+def parse_range(header, size):
+    """
+    Return `(start, end)` (inclusive) for a single `bytes=` range, `None` when the header
+    is absent or not something we serve partially, or raise ValueError if unsatisfiable.
+    """
+    if not header:
+        return None
+    match = RANGE_RE.match(header.strip())
+    if not match:
+        # Multiple ranges or other units: answering with the whole file is allowed.
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # Suffix range: the last N bytes.
+        length = int(last)
+        if length == 0:
+            raise ValueError('empty suffix range')
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError('range not satisfiable')
+    return start, end
+
+
+def iter_file_range(file, start, length):
+    try:
+        file.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = file.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+    finally:
+        file.close()
+
+
+def content_disposition(filename, as_attachment):
+    kind = 'attachment' if as_attachment else 'inline'
+    return f"{kind}; filename*=UTF-8''{quote(filename)}"
+
+
+def offloaded_response(field_file, filename, content_type, as_attachment):
+    """
+    Let the front-end web server send the bytes (and handle Range itself) when
+    FILE_DOWNLOAD_OFFLOAD is configured; the worker only authorizes the download.
+    """
+    mode = getattr(settings, 'FILE_DOWNLOAD_OFFLOAD', None)
+    if not mode:
+        return None
+    response = HttpResponse(content_type=content_type)
+    if mode == 'nginx':
+        response['X-Accel-Redirect'] = getattr(settings, 'FILE_DOWNLOAD_ACCEL_PREFIX', '/protected-media/') + quote(field_file.name)
+    elif mode == 'sendfile':
+        response['X-Sendfile'] = field_file.path
+    else:
+        raise ValueError(f'Unknown FILE_DOWNLOAD_OFFLOAD mode: {mode!r}')
+    response['Content-Disposition'] = content_disposition(filename, as_attachment)
+    return response
+
+
+def file_response(request, field_file, as_attachment=False):
+    """Stream a stored file, honouring single byte-range requests, without reading it into memory."""
+    if not field_file or not field_file.storage.exists(field_file.name):
+        raise Http404('File not found.')
+
+    filename = os.path.basename(field_file.name)
+    content_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+
+    offloaded = offloaded_response(field_file, filename, content_type, as_attachment)
+    if offloaded is not None:
+        return offloaded
+
+    size = field_file.storage.size(field_file.name)
+    try:
+        byte_range = parse_range(request.headers.get('Range'), size)
+    except ValueError:
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{size}'
+        return response
+
+    file = field_file.storage.open(field_file.name, 'rb')
+    if byte_range is None:
+        response = FileResponse(file, content_type=content_type, as_attachment=as_attachment, filename=filename)
+    else:
+        start, end = byte_range
+        length = end - start + 1
+        response = StreamingHttpResponse(iter_file_range(file, start, length), status=206, content_type=content_type)
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+        response['Content-Length'] = str(length)
+        response['Content-Disposition'] = content_disposition(filename, as_attachment)
+    response['Accept-Ranges'] = 'bytes'
+    return response
+
+
+class FileDownloadMixin:
+    """Adds `GET <resource>/<pk>/download/` serving the model's `download_field`."""
+    download_field = None
+
+    @action(detail=True, methods=['get'])
+    def download(self, request, *args, **kwargs):
+        instance = self.get_object()
+        as_attachment = request.query_params.get('attachment') in ('1', 'true')
+        return file_response(request, getattr(instance, self.download_field), as_attachment=as_attachment)
@@ -0,0 +1,100 @@
+from rest_framework.exceptions import ValidationError
+
+
+def parse_field_list(value):
+    return [name for name in (item.strip() for item in (value or '').split(',')) if name]
+
+
+def narrow_queryset(queryset, serializer, names, extra=()):
+    """
+    Restrict `queryset` with `.only()` to the columns the named fields of `serializer`
+    read, and drop `select_related` joins for relations that are not rendered. Computed
+    fields (`source='*'`) declare their columns in the serializer's `field_dependencies`.
+    """
+    model = queryset.model
+    concrete = {field.name for field in model._meta.concrete_fields}
+    dependencies = getattr(serializer, 'field_dependencies', {})
+    columns = {model._meta.pk.name}
+    columns.update(name for name in extra if name in concrete)
+    for name in names:
+        field = serializer.fields[name]
+        sources = dependencies.get(name, ()) if field.source == '*' else [field.source.split('.')[0]]
+        columns.update(source for source in sources if source in concrete)
+
+    if isinstance(queryset.query.select_related, dict):
+        related = [name for name in queryset.query.select_related if name in columns]
+        queryset = queryset.select_related(None)
+        if related:
+            queryset = queryset.select_related(*related)
+    return queryset.only(*columns)
+
+
+class SparseFieldsetMixin:
+    """
+    `list` renders `summary_serializer_class`, which leaves out long text and nested
+    users, and `retrieve` renders the full serializer. Either accepts `?fields=a,b` to
+    render exactly those fields of the full serializer (plus the primary key), or
+    `?expand=a,b` to add them to the default set. The queryset is narrowed to match, so
+    columns and joins nothing renders are never fetched or decoded.
+    """
+    summary_serializer_class = None
+    sparse_actions = ('list', 'retrieve')
+
+    def get_full_serializer_class(self):
+        return super().get_serializer_class()
+
+    def uses_summary(self):
+        params = self.request.query_params
+        return (
+            self.action == 'list'
+            and self.summary_serializer_class is not None
+            and not params.get('fields')
+            and not params.get('expand')
+        )
+
+    def get_serializer_class(self):
+        if self.uses_summary():
+            return self.summary_serializer_class
+        return self.get_full_serializer_class()
+
+    def get_selected_fields(self):
+        """Field names to render, in serializer order, or None for every field."""
+        if getattr(self, 'action', None) not in self.sparse_actions:
+            return None
+        if hasattr(self, '_selected_fields'):
+            return self._selected_fields
+
+        params = self.request.query_params
+        fields = parse_field_list(params.get('fields'))
+        expand = parse_field_list(params.get('expand'))
+        available = list(self.get_full_serializer_class()().fields)
+        unknown = [name for name in fields + expand if name not in available]
+        if unknown:
+            raise ValidationError({'fields': f"Unknown field: {', '.join(unknown)}"})
+
+        if fields:
+            selected = {self.queryset.model._meta.pk.name, *fields}
+        elif self.action == 'list' and self.summary_serializer_class is not None:
+            selected = {*self.summary_serializer_class().fields, *expand}
+        else:
+            selected = None
+        self._selected_fields = None if selected is None else [name for name in available if name in selected]
+        return self._selected_fields
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        selected = self.get_selected_fields()
+        if selected is not None:
+            target = getattr(serializer, 'child', serializer)
+            for name in [name for name in target.fields if name not in selected]:
+                target.fields.pop(name)
+        return serializer
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        selected = self.get_selected_fields()
+        if selected is None:
+            return queryset
+        # Cursor pages read the ordering fields of the last row to build the next link.
+        ordering = [name.lstrip('-') for name in getattr(self, 'cursor_ordering', ())]
+        return narrow_queryset(queryset, self.get_full_serializer_class()(), selected, ordering)
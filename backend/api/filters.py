@@ -0,0 +1,83 @@
+import datetime
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+TRUE_VALUES = {'1', 'true', 'yes', 'on'}
+
+
+def parse_bool(value):
+    return str(value).strip().lower() in TRUE_VALUES
+
+
+def parse_date_param(name, value, end_of_day=False):
+    """Accept either an ISO date or datetime. A bare date is the start (or end) of that day."""
+    try:
+        date = parse_date(value)
+        if date is not None:
+            parsed = datetime.datetime.combine(date, datetime.time.max if end_of_day else datetime.time.min)
+        else:
+            parsed = parse_datetime(value)
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise ValidationError({name: f'Enter a valid date or datetime, got "{value}".'})
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+class FieldFilter(BaseFilterBackend):
+    """
+    Exact-match filters for the fields a viewset lists in `filter_fields`.
+    A comma separated value matches any of the given values, e.g. `?status=Draft,Published`.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        for field_name in getattr(view, 'filter_fields', []):
+            value = request.query_params.get(field_name)
+            if not value:
+                continue
+            values = [item.strip() for item in value.split(',') if item.strip()]
+            field = queryset.model._meta.get_field(field_name)
+            if field.choices:
+                valid = {choice for choice, label in field.choices}
+                invalid = [item for item in values if item not in valid]
+                if invalid:
+                    raise ValidationError({field_name: f'Invalid choice: {", ".join(invalid)}.'})
+            try:
+                # Foreign keys convert to the target's type, so "?assigned_to=abc" is a 400.
+                values = [field.to_python(item) for item in values]
+            except DjangoValidationError:
+                raise ValidationError({field_name: f'Enter valid values, got "{value}".'})
+            queryset = queryset.filter(**{f'{field_name}__in': values})
+        return queryset
+
+
+class DateRangeFilter(BaseFilterBackend):
+    """
+    `<field>_after` / `<field>_before` filters for the fields a viewset lists in
+    `date_range_fields`. Both bounds are inclusive.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        for field_name in getattr(view, 'date_range_fields', []):
+            after = request.query_params.get(f'{field_name}_after')
+            before = request.query_params.get(f'{field_name}_before')
+            if after:
+                queryset = queryset.filter(**{f'{field_name}__gte': parse_date_param(f'{field_name}_after', after)})
+            if before:
+                queryset = queryset.filter(**{f'{field_name}__lte': parse_date_param(f'{field_name}_before', before, end_of_day=True)})
+        return queryset
+
+
+class ActiveFilter(BaseFilterBackend):
+    """`?active=true` narrows the queryset to the model's `active()` scope."""
+
+    def filter_queryset(self, request, queryset, view):
+        if parse_bool(request.query_params.get('active', '')):
+            return queryset.active()
+        return queryset
@@ -0,0 +1,164 @@
+import logging
+import math
+import posixpath
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.utils import timezone
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from .cache import invalidate
+from .models import Gallery
+from .tasks import task
+
+logger = logging.getLogger(__name__)
+
+# Gallery photos are re-encoded as WebP at these widths (never upscaled), and the page
+# picks one through srcset; a blurhash string paints a placeholder before any bytes load.
+VARIANT_WIDTHS = (320, 640, 1280, 1920)
+WEBP_QUALITY = 80
+BLURHASH_COMPONENTS = (4, 3)
+BLURHASH_SAMPLE = 32
+
+
+def variant_prefix(source_name):
+    stem, _ = posixpath.splitext(source_name)
+    return f'{stem}-'
+
+
+def variant_name(source_name, width):
+    return f'{variant_prefix(source_name)}{width}w.webp'
+
+
+def has_current_variants(gallery):
+    prefix = variant_prefix(gallery.file_path.name)
+    return bool(gallery.variants) and all(variant['name'].startswith(prefix) for variant in gallery.variants)
+
+
+def delete_variants(storage, variants):
+    for variant in variants or []:
+        storage.delete(variant['name'])
+
+
+def encode_variant(image, width):
+    height = max(round(image.height * width / image.width), 1)
+    resized = image.resize((width, height), Image.Resampling.LANCZOS)
+    buffer = BytesIO()
+    resized.save(buffer, 'WEBP', quality=WEBP_QUALITY, method=4)
+    return height, buffer.getvalue()
+
+
+def build_variants(gallery):
+    """
+    Generate the WebP variants and blurhash for one photo and store their metadata.
+    Returns False when the file is not an image Pillow can read.
+    """
+    field_file = gallery.file_path
+    storage = field_file.storage
+    try:
+        with storage.open(field_file.name, 'rb') as source:
+            image = Image.open(source)
+            image = ImageOps.exif_transpose(image)
+            image.load()
+    except (FileNotFoundError, UnidentifiedImageError, OSError):
+        logger.warning('Gallery %s: %s is not a readable image', gallery.pk, field_file.name)
+        return False
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA' if 'transparency' in image.info else 'RGB')
+
+    widths = [width for width in VARIANT_WIDTHS if width < image.width] or [image.width]
+    if image.width <= VARIANT_WIDTHS[-1] and image.width not in widths:
+        widths.append(image.width)
+
+    variants = []
+    for width in widths:
+        height, data = encode_variant(image, width)
+        name = storage.save(variant_name(field_file.name, width), ContentFile(data))
+        variants.append({'width': width, 'height': height, 'size': len(data), 'name': name})
+
+    stale = [variant for variant in gallery.variants or [] if variant['name'] not in {v['name'] for v in variants}]
+    # A queryset update keeps the save signals (and this pipeline) from firing again;
+    # bumping updated_at and the cache generation keeps ETags and cached lists honest.
+    Gallery.objects.filter(pk=gallery.pk).update(
+        width=image.width,
+        height=image.height,
+        variants=variants,
+        blurhash=blurhash(image),
+        updated_at=timezone.now(),
+    )
+    invalidate(Gallery)
+    delete_variants(storage, stale)
+    return True
+
+
+@task(max_attempts=3)
+def process_gallery(media_id):
+    """Build the variants for a photo, unless they already match its current file."""
+    gallery = Gallery.objects.filter(pk=media_id, type='Photo').first()
+    if gallery is not None and gallery.file_path and not has_current_variants(gallery):
+        build_variants(gallery)
+
+
+BASE83 = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~'
+
+
+def _base83(value, length):
+    return ''.join(BASE83[(value // 83 ** (length - position - 1)) % 83] for position in range(length))
+
+
+def _srgb_to_linear(value):
+    value /= 255
+    return value / 12.92 if value <= 0.04045 else ((value + 0.055) / 1.055) ** 2.4
+
+
+def _linear_to_srgb(value):
+    value = min(max(value, 0.0), 1.0)
+    if value <= 0.0031308:
+        return int(value * 12.92 * 255 + 0.5)
+    return int((1.055 * value ** (1 / 2.4) - 0.055) * 255 + 0.5)
+
+
+def _sign_pow(value, exponent):
+    return math.copysign(abs(value) ** exponent, value)
+
+
+def blurhash(image, components=BLURHASH_COMPONENTS):
+    """Encode a blurhash (https://blurha.sh) from a small downsample of the image."""
+    components_x, components_y = components
+    sample = image.convert('RGB')
+    sample.thumbnail((BLURHASH_SAMPLE, BLURHASH_SAMPLE))
+    width, height = sample.size
+    table = [_srgb_to_linear(value) for value in range(256)]
+    pixels = [(table[r], table[g], table[b]) for r, g, b in sample.getdata()]
+
+    factors = []
+    for j in range(components_y):
+        cos_y = [math.cos(math.pi * j * y / height) for y in range(height)]
+        for i in range(components_x):
+            cos_x = [math.cos(math.pi * i * x / width) for x in range(width)]
+            r = g = b = 0.0
+            for y in range(height):
+                row = y * width
+                for x in range(width):
+                    basis = cos_x[x] * cos_y[y]
+                    pr, pg, pb = pixels[row + x]
+                    r += basis * pr
+                    g += basis * pg
+                    b += basis * pb
+            scale = (1 if i == j == 0 else 2) / (width * height)
+            factors.append((r * scale, g * scale, b * scale))
+
+    dc, ac = factors[0], factors[1:]
+    result = _base83((components_x - 1) + (components_y - 1) * 9, 1)
+    if ac:
+        quantised_max = max(0, min(82, math.floor(max(abs(v) for factor in ac for v in factor) * 166 - 0.5)))
+        maximum = (quantised_max + 1) / 166
+        result += _base83(quantised_max, 1)
+    else:
+        maximum = 1
+        result += _base83(0, 1)
+    result += _base83((_linear_to_srgb(dc[0]) << 16) + (_linear_to_srgb(dc[1]) << 8) + _linear_to_srgb(dc[2]), 4)
+    for factor in ac:
+        r, g, b = (max(0, min(18, math.floor(_sign_pow(v / maximum, 0.5) * 9 + 9.5))) for v in factor)
+        result += _base83(r * 19 * 19 + g * 19 + b, 2)
+    return result
@@ -0,0 +1,45 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+
+from api.archival import archive_expired
+
+
+class Command(BaseCommand):
+    help = (
+        'Archive published notices past their expiry date and mark tenders past their '
+        'submission deadline as closed. Run it from cron, or pass --interval to keep it '
+        'running and repeat on a schedule.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=0, help='Rows per UPDATE statement; 0 updates all in one.')
+        parser.add_argument('--interval', type=float, default=0, help='Repeat every this many seconds instead of exiting.')
+        parser.add_argument('--dry-run', action='store_true', help='Count the rows that would change; write nothing.')
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 0:
+            raise CommandError('--batch-size must not be negative')
+        if options['interval'] < 0:
+            raise CommandError('--interval must not be negative')
+
+        try:
+            while True:
+                self.run_once(options)
+                if not options['interval']:
+                    break
+                # Don't hold a connection open between runs.
+                close_old_connections()
+                time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            self.stdout.write('Stopping')
+
+    def run_once(self, options):
+        started = time.monotonic()
+        counts = archive_expired(batch_size=options['batch_size'] or None, dry_run=options['dry_run'])
+        archive, close = ('Would archive', 'close') if options['dry_run'] else ('Archived', 'closed')
+        self.stdout.write(self.style.SUCCESS(
+            f"{archive} {counts['notices']} notices and {close} {counts['tenders']} tenders "
+            f'in {time.monotonic() - started:.2f}s'
+        ))
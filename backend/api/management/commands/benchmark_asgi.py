@@ -0,0 +1,121 @@
+import asyncio
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand
+from django.test import AsyncRequestFactory, RequestFactory
+from django.utils import timezone
+
+from api.cache import invalidate
+from api.models import Notice, User
+
+USERNAME = 'asgi-benchmark'
+
+
+class Command(BaseCommand):
+    help = (
+        'Load the public notice list through the WSGI handler (a thread per in-flight request) '
+        'and the async endpoint through the ASGI handler (one event loop), in process, and '
+        'report throughput and latency percentiles. Seeds benchmark notices and removes them.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=500, help='Requests per scenario.')
+        parser.add_argument('--concurrency', type=int, default=20, help='Requests in flight at once.')
+        parser.add_argument('--rows', type=int, default=200, help='Notices seeded before the runs.')
+
+    def handle(self, *args, **options):
+        self.host = next((host.lstrip('.') for host in settings.ALLOWED_HOSTS if host != '*'), 'localhost')
+        user = self.seed(options['rows'])
+        try:
+            self.stdout.write(f"{'scenario':<32} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}")
+            for cached in (False, True):
+                label = 'cached' if cached else 'uncached'
+                for server, run in (('WSGI', self.run_wsgi), ('ASGI', self.run_asgi)):
+                    path = '/api/notices/?page_size=20' if server == 'WSGI' else '/api/async/notices/?limit=20'
+                    paths = [path if cached else f'{path}&_={number}' for number in range(options['requests'])]
+                    elapsed, timings, errors = run(paths, options['concurrency'])
+                    self.report(f'{server}, {label}', elapsed, timings, errors)
+        finally:
+            Notice.objects.filter(created_by=user).delete()
+            user.delete()
+            invalidate(Notice)
+
+    def seed(self, rows):
+        User.objects.filter(username=USERNAME).delete()
+        user = User.objects.create_user(username=USERNAME, email=f'{USERNAME}@example.com')
+        now = timezone.now()
+        # bulk_create skips the signals that bump the cache generation, so do it here.
+        Notice.objects.bulk_create([
+            Notice(title=f'Benchmark notice {number}', content='Benchmark', status='Published', publish_date=now, created_by=user)
+            for number in range(rows)
+        ])
+        invalidate(Notice)
+        return user
+
+    def run_wsgi(self, paths, concurrency):
+        handler = WSGIHandler()
+        factory = RequestFactory(headers={'host': self.host})
+
+        def fetch(path):
+            environ = factory.get(path).environ
+            statuses = []
+            started = time.perf_counter()
+            body = b''.join(handler(environ, lambda status, headers, exc_info=None: statuses.append(status)))
+            return time.perf_counter() - started, statuses[0].startswith('200') and bool(body)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(fetch, paths))
+        return time.perf_counter() - started, *self.collect(results)
+
+    def run_asgi(self, paths, concurrency):
+        handler = ASGIHandler()
+        factory = AsyncRequestFactory()
+
+        async def fetch(path, slots):
+            async with slots:
+                scope = factory.get(path).scope
+                scope['headers'] = [(b'host', self.host.encode())] + [header for header in scope['headers'] if header[0] != b'host']
+                messages = []
+                finished = asyncio.Event()
+                request_sent = False
+
+                async def receive():
+                    nonlocal request_sent
+                    if not request_sent:
+                        request_sent = True
+                        return {'type': 'http.request', 'body': b'', 'more_body': False}
+                    await finished.wait()
+                    return {'type': 'http.disconnect'}
+
+                async def send(message):
+                    messages.append(message)
+
+                started = time.perf_counter()
+                await handler(scope, receive, send)
+                finished.set()
+                elapsed = time.perf_counter() - started
+                return elapsed, messages[0].get('status') == 200 and any(message.get('body') for message in messages[1:])
+
+        async def main():
+            slots = asyncio.Semaphore(concurrency)
+            return await asyncio.gather(*(fetch(path, slots) for path in paths))
+
+        started = time.perf_counter()
+        results = asyncio.run(main())
+        return time.perf_counter() - started, *self.collect(results)
+
+    def collect(self, results):
+        return sorted(elapsed for elapsed, _ in results), sum(1 for _, ok in results if not ok)
+
+    def report(self, label, elapsed, timings, errors):
+        cuts = statistics.quantiles(timings, n=100)
+        self.stdout.write(
+            f'{label:<32} {len(timings) / elapsed:>8.0f} '
+            f'{cuts[49] * 1000:>8.2f} {cuts[94] * 1000:>8.2f} {cuts[98] * 1000:>8.2f} {errors:>7}'
+        )
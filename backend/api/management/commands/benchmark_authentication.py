@@ -0,0 +1,84 @@
+import base64
+import time
+from importlib import import_module
+
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY, get_user
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils.functional import SimpleLazyObject
+from rest_framework.authentication import BasicAuthentication, SessionAuthentication, TokenAuthentication
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rest_framework.test import APIRequestFactory
+
+from api.authentication import CachedTokenAuthentication, issue_token, token_cache
+from api.models import User
+
+PASSWORD = 'benchmark-pass-123'
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure the per-request cost of each authenticator, including the anonymous path '
+        'public reads take. Runs in a transaction that is rolled back.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=500, help='Requests per scenario.')
+
+    def handle(self, *args, **options):
+        count = options['requests']
+        with transaction.atomic():
+            user = User.objects.create_user(username='auth-benchmark', email='auth-benchmark@example.com', password=PASSWORD)
+            token = issue_token(user)
+            session_key = self.create_session(user)
+            basic = base64.b64encode(f'{user.username}:{PASSWORD}'.encode()).decode()
+            default_chain = [cls() for cls in api_settings.DEFAULT_AUTHENTICATION_CLASSES]
+
+            scenarios = [
+                ('anonymous, no authenticators (public reads)', [], {}, count, None),
+                ('anonymous, default chain', default_chain, {}, count, None),
+                ('TokenAuthentication (uncached)', [TokenAuthentication()], {'HTTP_AUTHORIZATION': f'Token {token.key}'}, count, None),
+                ('CachedTokenAuthentication, cold', [CachedTokenAuthentication()], {'HTTP_AUTHORIZATION': f'Token {token.key}'}, count, token_cache.clear),
+                ('CachedTokenAuthentication, warm', [CachedTokenAuthentication()], {'HTTP_AUTHORIZATION': f'Token {token.key}'}, count, None),
+                ('SessionAuthentication', [SessionAuthentication()], {'session_key': session_key}, count, None),
+                # Every request hashes the password, so a handful is enough to show the cost.
+                ('BasicAuthentication', [BasicAuthentication()], {'HTTP_AUTHORIZATION': f'Basic {basic}'}, max(count // 100, 3), None),
+            ]
+            self.stdout.write(f"{'scenario':<45} {'per request':>12} {'queries':>8}")
+            for label, authenticators, headers, requests, before_each in scenarios:
+                elapsed, queries = self.measure(authenticators, headers, requests, before_each)
+                self.stdout.write(f'{label:<45} {elapsed * 1e6:>9.1f} µs {queries:>8.1f}')
+            transaction.set_rollback(True)
+        token_cache.clear()
+
+    def create_session(self, user):
+        store = import_module(settings.SESSION_ENGINE).SessionStore()
+        store[SESSION_KEY] = str(user.pk)
+        store[BACKEND_SESSION_KEY] = 'django.contrib.auth.backends.ModelBackend'
+        store[HASH_SESSION_KEY] = user.get_session_auth_hash()
+        store.save()
+        return store.session_key
+
+    def build_request(self, authenticators, headers):
+        headers = dict(headers)
+        session_key = headers.pop('session_key', None)
+        django_request = APIRequestFactory().get('/api/notices/', **headers)
+        if session_key:
+            django_request.session = import_module(settings.SESSION_ENGINE).SessionStore(session_key)
+            django_request.user = SimpleLazyObject(lambda: get_user(django_request))
+        return Request(django_request, authenticators=authenticators)
+
+    def measure(self, authenticators, headers, requests, before_each):
+        total = 0.0
+        with CaptureQueriesContext(connection) as queries:
+            for _ in range(requests):
+                if before_each:
+                    before_each()
+                request = self.build_request(authenticators, headers)
+                started = time.perf_counter()
+                request.user
+                total += time.perf_counter() - started
+        return total / requests, len(queries) / requests
@@ -0,0 +1,75 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from api.cache import get_cache
+from api.models import Permission, Role, RolePermissions, User, UserRoles
+from api.permissions import get_role_permissions, has_role_permission
+
+
+class Command(BaseCommand):
+    help = (
+        'Time role permission checks against users with growing numbers of roles and grants, '
+        'cold (first check of a request) and warm. Runs in a transaction that is rolled back, '
+        'against a private in-memory cache so the shared one is left alone.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='1,10,50', help='Comma separated role counts to test.')
+        parser.add_argument('--permissions-per-role', type=int, default=20)
+        parser.add_argument('--checks', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        sizes = [int(size) for size in options['sizes'].split(',') if size]
+        self.stdout.write(f"{'roles':>6} {'grants':>7} {'uncached':>12} {'shared cache':>13} {'per request':>12}")
+        # The uncached run clears the cache before every check, which must not flush live
+        # responses, throttle counters or token generations.
+        caches = {**settings.CACHES, 'benchmark-permissions': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'benchmark-permissions',
+        }}
+        with override_settings(CACHES=caches, RESPONSE_CACHE_ALIAS='benchmark-permissions'), transaction.atomic():
+            for size in sizes:
+                self.stdout.write(self.measure(size, options['permissions_per_role'], options['checks']))
+            transaction.set_rollback(True)
+
+    def measure(self, roles, per_role, checks):
+        user = User.objects.create_user(username=f'bench-{roles}', email=f'bench-{roles}@example.com')
+        for index in range(roles):
+            role = Role.objects.create(role_name=f'bench-{roles}-{index}')
+            UserRoles.objects.create(user=user, role=role)
+            for number in range(per_role):
+                permission, _ = Permission.objects.get_or_create(permission_name=f'bench.perm_{index}_{number}')
+                RolePermissions.objects.create(role=role, permission=permission)
+        name = f'bench.perm_{roles - 1}_{per_role - 1}'
+
+        # Uncached: every check resolves the set from the database, as a naive check would.
+        started = time.perf_counter()
+        with CaptureQueriesContext(connection) as queries:
+            for _ in range(checks // 10 or 1):
+                get_cache().clear()
+                fresh = User.objects.get(pk=user.pk)
+                has_role_permission(fresh, name)
+        uncached = (time.perf_counter() - started) / (checks // 10 or 1)
+        query_count = len(queries) // (checks // 10 or 1)
+
+        # Shared cache: a new request (fresh user object) with the set already cached.
+        get_role_permissions(user)
+        started = time.perf_counter()
+        for _ in range(checks):
+            request_user = User(pk=user.pk, is_active=True)
+            has_role_permission(request_user, name)
+        shared = (time.perf_counter() - started) / checks
+
+        started = time.perf_counter()
+        for _ in range(checks):
+            has_role_permission(user, name)
+        memo = (time.perf_counter() - started) / checks
+
+        return (
+            f'{roles:>6} {roles * per_role:>7} {uncached * 1e6:>9.1f} µs {shared * 1e6:>10.1f} µs {memo * 1e6:>9.2f} µs'
+            f'   ({query_count} queries per uncached check)'
+        )
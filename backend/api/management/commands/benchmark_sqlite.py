@@ -0,0 +1,133 @@
+import os
+import sqlite3
+import statistics
+import tempfile
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+
+from backend.database import sqlite_pragmas
+
+SCHEMA = """
+    CREATE TABLE feedback (
+        feedback_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        subject VARCHAR(255) NOT NULL,
+        message TEXT NOT NULL,
+        submitted_date DATETIME NOT NULL,
+        status VARCHAR(20) NOT NULL
+    )
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure concurrent read/write throughput on a scratch SQLite database, '
+        'first with SQLite defaults and then with the configured connection pragmas.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seconds', type=float, default=5.0, help='Duration of each run.')
+        parser.add_argument('--readers', type=int, default=8)
+        parser.add_argument('--writers', type=int, default=4)
+        parser.add_argument('--rows', type=int, default=20000, help='Rows seeded before each run.')
+
+    def handle(self, *args, **options):
+        runs = [
+            # What Django used before: rollback journal and the sqlite3 module's 5s timeout.
+            ('defaults', {'journal_mode': 'DELETE', 'busy_timeout': 5000}, 'DEFERRED'),
+            ('tuned', sqlite_pragmas(), 'IMMEDIATE'),
+        ]
+        self.stdout.write(
+            f"{options['readers']} readers, {options['writers']} writers, {options['seconds']}s per run, "
+            f"{options['rows']} seeded rows"
+        )
+        for label, pragmas, begin in runs:
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, 'bench.sqlite3')
+                result = self.run(path, pragmas, begin, options)
+            self.report(label, pragmas, begin, result, options['seconds'])
+
+    def connect(self, path, pragmas, setup=False):
+        # isolation_level=None leaves transaction control to the explicit BEGIN below;
+        # timeout=0 so that only the busy_timeout pragma decides how long to wait.
+        conn = sqlite3.connect(path, timeout=0, isolation_level=None, check_same_thread=False)
+        conn.execute(f"PRAGMA busy_timeout = {pragmas.get('busy_timeout', 0)}")
+        for name, value in pragmas.items():
+            # journal_mode is stored in the database file, so it is set once at setup.
+            if name != 'busy_timeout' and (setup or name != 'journal_mode'):
+                conn.execute(f'PRAGMA {name} = {value}')
+        return conn
+
+    def run(self, path, pragmas, begin, options):
+        setup = self.connect(path, pragmas, setup=True)
+        setup.execute(SCHEMA)
+        setup.execute('CREATE INDEX feedback_submitted ON feedback (submitted_date DESC)')
+        setup.executemany(
+            "INSERT INTO feedback (subject, message, submitted_date, status) VALUES (?, ?, datetime('now'), 'New')",
+            (('Seed', 'Seed message') for _ in range(options['rows'])),
+        )
+        setup.close()
+
+        stop = threading.Event()
+        stats = {'read': [], 'write': [], 'read_errors': 0, 'write_errors': 0}
+        lock = threading.Lock()
+
+        def reader():
+            conn = self.connect(path, pragmas)
+            latencies, errors = [], 0
+            while not stop.is_set():
+                started = time.perf_counter()
+                try:
+                    conn.execute('SELECT * FROM feedback ORDER BY submitted_date DESC LIMIT 20').fetchall()
+                    conn.execute("SELECT COUNT(*) FROM feedback WHERE status = 'New'").fetchone()
+                    latencies.append(time.perf_counter() - started)
+                except sqlite3.OperationalError:
+                    errors += 1
+            conn.close()
+            with lock:
+                stats['read'] += latencies
+                stats['read_errors'] += errors
+
+        def writer():
+            conn = self.connect(path, pragmas)
+            latencies, errors = [], 0
+            while not stop.is_set():
+                started = time.perf_counter()
+                try:
+                    conn.execute(f'BEGIN {begin}')
+                    conn.execute(
+                        "INSERT INTO feedback (subject, message, submitted_date, status) "
+                        "VALUES ('Bench', 'Benchmark message', datetime('now'), 'New')"
+                    )
+                    conn.execute('COMMIT')
+                    latencies.append(time.perf_counter() - started)
+                except sqlite3.OperationalError:
+                    errors += 1
+                    if conn.in_transaction:
+                        conn.execute('ROLLBACK')
+            conn.close()
+            with lock:
+                stats['write'] += latencies
+                stats['write_errors'] += errors
+
+        threads = [threading.Thread(target=reader) for _ in range(options['readers'])]
+        threads += [threading.Thread(target=writer) for _ in range(options['writers'])]
+        for thread in threads:
+            thread.start()
+        time.sleep(options['seconds'])
+        stop.set()
+        for thread in threads:
+            thread.join()
+        return stats
+
+    def report(self, label, pragmas, begin, stats, seconds):
+        settings_text = ', '.join(f'{name}={value}' for name, value in pragmas.items())
+        self.stdout.write(self.style.MIGRATE_HEADING(f'{label}: {settings_text}, BEGIN {begin}'))
+        for kind in ('read', 'write'):
+            latencies = stats[kind]
+            p95 = statistics.quantiles(latencies, n=20)[-1] * 1000 if len(latencies) >= 20 else float('nan')
+            self.stdout.write(
+                f'  {kind:5}: {len(latencies) / seconds:9.0f} ops/s  '
+                f'p95 {p95:7.2f} ms  "database is locked" errors: {stats[f"{kind}_errors"]}'
+            )
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from api.urls import router
+
+
+# Representative WHERE clauses used by the public portal pages, keyed by route prefix.
+SAMPLE_FILTERS = {
+    'notices': [{'status': 'Published'}],
+    'news-events': [{'type': 'News'}],
+    'gallery': [{'type': 'Photo'}],
+    'documents': [{'category': 'Forms'}],
+    'feedback': [{'status': 'New'}],
+}
+
+
+class Command(BaseCommand):
+    help = 'Print the database query plan for each list endpoint to verify index usage.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('endpoints', nargs='*', help='Route prefixes to explain, e.g. notices gallery. Defaults to all.')
+        parser.add_argument('--page-size', type=int, default=20)
+
+    def handle(self, *args, **options):
+        registry = {prefix: viewset for prefix, viewset, basename in router.registry}
+        endpoints = options['endpoints'] or list(registry)
+        unknown = set(endpoints) - set(registry)
+        if unknown:
+            raise CommandError(f"Unknown endpoints: {', '.join(sorted(unknown))}")
+
+        self.stdout.write(f'Database vendor: {connection.vendor}')
+        for prefix in endpoints:
+            viewset = registry[prefix]
+            if getattr(viewset, 'queryset', None) is None:
+                continue
+            ordering = getattr(viewset, 'cursor_ordering', ('-pk',))
+            if isinstance(ordering, str):
+                ordering = (ordering,)
+            for filters in [{}] + SAMPLE_FILTERS.get(prefix, []):
+                queryset = viewset.queryset.filter(**filters).order_by(*ordering)[:options['page_size']]
+                label = ', '.join(f'{key}={value!r}' for key, value in filters.items()) or 'unfiltered'
+                self.stdout.write(self.style.MIGRATE_HEADING(f'/api/{prefix}/ ({label}, order by {", ".join(ordering)})'))
+                self.stdout.write(queryset.explain())
@@ -0,0 +1,171 @@
+import csv
+import json
+import sys
+import time
+from itertools import islice
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, models, transaction
+from django.utils import timezone
+
+from api import search
+from api.cache import invalidate
+from api.models import Notice, SchemesAndProjects, Tender, User
+
+MODELS = {
+    'notice': Notice,
+    'tender': Tender,
+    'scheme_project': SchemesAndProjects,
+}
+# Columns holding a username or e-mail address, resolved to a user id before saving.
+OWNER_FIELDS = {
+    'notice': 'created_by',
+}
+
+
+class Command(BaseCommand):
+    help = (
+        'Import notices, tenders or schemes/projects from a CSV or JSONL file (or stdin), '
+        'validating each row and writing them with bulk_create in batches.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV or JSONL file to read, or - for stdin.')
+        parser.add_argument('--type', dest='content_type', required=True, choices=sorted(MODELS))
+        parser.add_argument('--format', choices=['csv', 'jsonl'], help='Input format. Defaults to the file extension.')
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--default-user', help='Username or e-mail used when a row has no created_by.')
+        parser.add_argument('--rejects', help='Write rejected rows with their errors to this JSONL file.')
+        parser.add_argument('--dry-run', action='store_true', help='Validate only; write nothing.')
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be positive')
+        content_type = options['content_type']
+        self.model = MODELS[content_type]
+        self.owner_field = OWNER_FIELDS.get(content_type)
+        self.fields = {
+            field.name: field for field in self.model._meta.concrete_fields
+            if not field.auto_created and not getattr(field, 'auto_now', False) and not getattr(field, 'auto_now_add', False)
+        }
+        self.users = self.load_users() if self.owner_field else {}
+        self.default_user = None
+        if options['default_user']:
+            self.default_user = self.users.get(options['default_user'].lower())
+            if self.default_user is None:
+                raise CommandError(f"Unknown user: {options['default_user']}")
+
+        path = options['path']
+        input_format = options['format'] or ('jsonl' if path.endswith(('.jsonl', '.ndjson')) else 'csv')
+        source = sys.stdin if path == '-' else open(path, encoding='utf-8-sig', newline='')
+        rejects = open(options['rejects'], 'w', encoding='utf-8') if options['rejects'] else None
+        imported = rejected = 0
+        started = time.monotonic()
+        try:
+            rows = self.read_csv(source) if input_format == 'csv' else self.read_jsonl(source)
+            while True:
+                batch = list(islice(rows, options['batch_size']))
+                if not batch:
+                    break
+                instances, errors = self.validate(batch)
+                if instances and not options['dry_run']:
+                    try:
+                        self.write(instances)
+                    except DatabaseError as exc:
+                        errors += [(line, row, {'__all__': [str(exc)]}) for line, row, _ in instances]
+                        instances = []
+                imported += len(instances)
+                rejected += len(errors)
+                for line, row, error in errors:
+                    self.report_rejection(line, row, error, rejects)
+                if options['verbosity'] > 1:
+                    self.stdout.write(f'{imported} imported, {rejected} rejected')
+        finally:
+            if source is not sys.stdin:
+                source.close()
+            if rejects:
+                rejects.close()
+            if imported and not options['dry_run']:
+                invalidate(self.model)
+
+        elapsed = time.monotonic() - started
+        verb = 'Validated' if options['dry_run'] else 'Imported'
+        self.stdout.write(self.style.SUCCESS(
+            f'{verb} {imported} rows, rejected {rejected} in {elapsed:.2f}s '
+            f'({(imported + rejected) / elapsed if elapsed else 0:.0f} rows/s)'
+        ))
+
+    def load_users(self):
+        users = {}
+        for pk, username, email in User.objects.values_list('pk', 'username', 'email').iterator():
+            users[username.lower()] = pk
+            if email:
+                users.setdefault(email.lower(), pk)
+        return users
+
+    def read_csv(self, source):
+        reader = csv.DictReader(source)
+        unknown = set(reader.fieldnames or []) - set(self.fields)
+        if unknown:
+            raise CommandError(f"Unknown columns: {', '.join(sorted(unknown))}")
+        for row in reader:
+            # Blank CSV cells mean "no value".
+            yield reader.line_num, {name: value for name, value in row.items() if value != ''}
+
+    def read_jsonl(self, source):
+        for line_number, line in enumerate(source, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as exc:
+                yield line_number, {'__invalid__': str(exc)}
+                continue
+            yield line_number, row if isinstance(row, dict) else {'__invalid__': 'Expected a JSON object.'}
+
+    def validate(self, batch):
+        instances, errors = [], []
+        for line, row in batch:
+            try:
+                instances.append((line, row, self.build(row)))
+            except ValidationError as exc:
+                errors.append((line, row, exc.message_dict if hasattr(exc, 'error_dict') else {'__all__': exc.messages}))
+        return instances, errors
+
+    def build(self, row):
+        if '__invalid__' in row:
+            raise ValidationError(row['__invalid__'])
+        unknown = set(row) - set(self.fields)
+        if unknown:
+            raise ValidationError({name: ['Unknown field.'] for name in sorted(unknown)})
+
+        values = dict(row)
+        if self.owner_field:
+            owner = values.pop(self.owner_field, None)
+            owner_id = self.users.get(str(owner).lower()) if owner is not None else self.default_user
+            if owner_id is None:
+                message = f'Unknown user "{owner}".' if owner is not None else 'This field is required.'
+                raise ValidationError({self.owner_field: [message]})
+            values[f'{self.owner_field}_id'] = owner_id
+
+        instance = self.model(**values)
+        # Foreign keys are resolved above and uniqueness is left to the database.
+        instance.full_clean(exclude=[self.owner_field] if self.owner_field else None, validate_unique=False, validate_constraints=False)
+        for field in self.fields.values():
+            value = getattr(instance, field.attname)
+            if isinstance(field, models.DateTimeField) and value is not None and timezone.is_naive(value):
+                setattr(instance, field.attname, timezone.make_aware(value))
+        return instance
+
+    def write(self, instances):
+        with transaction.atomic():
+            created = self.model.objects.bulk_create([instance for _, _, instance in instances])
+            if self.model in search.SOURCES_BY_MODEL:
+                search.index_instances(self.model, created)
+
+    def report_rejection(self, line, row, errors, rejects):
+        if rejects:
+            rejects.write(json.dumps({'line': line, 'row': row, 'errors': errors}, default=str) + '\n')
+        else:
+            self.stderr.write(f'line {line}: {json.dumps(errors, default=str)}')
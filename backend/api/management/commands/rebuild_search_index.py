@@ -0,0 +1,83 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from api import search
+from api.models import SearchIndexEntry
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the search index from the content tables in fixed-size batches.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--type', dest='types', default='',
+            help=f"Comma separated content types to reindex ({', '.join(search.SOURCES_BY_TYPE)}). Defaults to all.",
+        )
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        types = [item for item in options['types'].split(',') if item] or list(search.SOURCES_BY_TYPE)
+        unknown = set(types) - set(search.SOURCES_BY_TYPE)
+        if unknown:
+            raise CommandError(f"Unknown content types: {', '.join(sorted(unknown))}")
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be positive')
+
+        started = time.monotonic()
+        total = 0
+        for content_type in types:
+            total += self.reindex(search.SOURCES_BY_TYPE[content_type], options['batch_size'])
+
+        if connection.vendor == 'sqlite':
+            with connection.cursor() as cursor:
+                cursor.execute("INSERT INTO api_searchindexentry_fts(api_searchindexentry_fts) VALUES ('optimize')")
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'Indexed {total} rows in {elapsed:.2f}s ({total / elapsed if elapsed else 0:.0f} rows/s)'
+        ))
+
+    def reindex(self, source, batch_size):
+        # Rows are read by primary-key keyset rather than one big queryset, so memory stays
+        # bounded by the batch size however large the table is. Entries not touched by this
+        # run belong to rows that no longer exist or are no longer searchable.
+        rebuild_started = timezone.now()
+        started = time.monotonic()
+        last_pk = None
+        indexed = skipped = 0
+        queryset = source.model.objects.order_by('pk')
+
+        while True:
+            batch = list((queryset if last_pk is None else queryset.filter(pk__gt=last_pk))[:batch_size])
+            if not batch:
+                break
+            last_pk = batch[-1].pk
+            entries = []
+            for instance in batch:
+                entry = source.entry_for(instance)
+                if entry is None:
+                    skipped += 1
+                    continue
+                entries.append(SearchIndexEntry(content_type=source.content_type, object_id=instance.pk, **entry))
+            with transaction.atomic():
+                SearchIndexEntry.objects.bulk_create(
+                    entries,
+                    update_conflicts=True,
+                    unique_fields=['content_type', 'object_id'],
+                    update_fields=['title', 'body', 'keys', 'updated_at'],
+                )
+            indexed += len(entries)
+
+        removed, _ = SearchIndexEntry.objects.filter(
+            content_type=source.content_type, updated_at__lt=rebuild_started,
+        ).delete()
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(
+            f'{source.content_type}: {indexed} indexed, {skipped} skipped, {removed} stale removed '
+            f'in {elapsed:.2f}s ({indexed / elapsed if elapsed else 0:.0f} rows/s)'
+        )
+        return indexed
@@ -0,0 +1,75 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+
+from api import tasks
+
+
+def run_task(task_row):
+    # Each pool thread keeps its own connection; recycle it like a request would.
+    close_old_connections()
+    try:
+        return tasks.execute(task_row)
+    finally:
+        close_old_connections()
+
+
+class Command(BaseCommand):
+    help = 'Run queued background tasks on a thread pool.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--concurrency', type=int, default=getattr(settings, 'TASKS_WORKER_CONCURRENCY', 4),
+            help='Maximum number of tasks running at once.',
+        )
+        parser.add_argument('--poll-interval', type=float, default=1.0, help='Seconds to sleep when the queue is empty.')
+        parser.add_argument('--once', action='store_true', help='Exit once no due tasks remain.')
+        parser.add_argument('--max-tasks', type=int, default=0, help='Exit after running this many tasks.')
+
+    def handle(self, *args, **options):
+        if tasks.get_backend() != 'database':
+            raise CommandError("run_worker needs TASKS_BACKEND = 'database'")
+        concurrency = options['concurrency']
+        if concurrency < 1:
+            raise CommandError('--concurrency must be positive')
+
+        worker = tasks.worker_name()
+        lock_timeout = getattr(settings, 'TASKS_LOCK_TIMEOUT', 600)
+        requeued = tasks.requeue_stale(lock_timeout)
+        if requeued:
+            self.stdout.write(f'Requeued {requeued} stale tasks')
+        self.stdout.write(f'Worker {worker} running with concurrency {concurrency}')
+
+        outcomes = {}
+        running = set()
+        started = 0
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='task-worker') as executor:
+            try:
+                while True:
+                    # Only claim as many tasks as there are idle threads, so nothing sits in
+                    # the Running state waiting for a slot while another worker could run it.
+                    free = concurrency - len(running)
+                    if options['max_tasks']:
+                        free = min(free, options['max_tasks'] - started)
+                    claimed = tasks.claim(worker, free) if free > 0 else []
+                    for task_row in claimed:
+                        running.add(executor.submit(run_task, task_row))
+                    started += len(claimed)
+
+                    if running:
+                        done, running = wait(running, timeout=options['poll_interval'], return_when=FIRST_COMPLETED)
+                        for future in done:
+                            outcome = future.result()
+                            outcomes[outcome] = outcomes.get(outcome, 0) + 1
+                    elif options['once'] or (options['max_tasks'] and started >= options['max_tasks']):
+                        break
+                    else:
+                        time.sleep(options['poll_interval'])
+            except KeyboardInterrupt:
+                self.stdout.write('Stopping; waiting for running tasks to finish')
+
+        summary = ', '.join(f'{count} {status.lower()}' for status, count in sorted(outcomes.items())) or 'no tasks'
+        self.stdout.write(self.style.SUCCESS(f'Worker {worker} finished: {summary}'))
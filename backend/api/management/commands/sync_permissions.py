@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from api.models import Permission
+from api.permissions import VERBS, permission_name
+from api.urls import router
+
+
+class Command(BaseCommand):
+    help = 'Create the Permission rows checked by the write and export endpoints of every registered viewset.'
+
+    def handle(self, *args, **options):
+        names = []
+        for prefix, viewset, basename in router.registry:
+            model = getattr(getattr(viewset, 'queryset', None), 'model', None)
+            if model is None:
+                continue
+            verbs = VERBS + ('export',) if getattr(viewset, 'export_fields', None) else VERBS
+            names += [name for name in (permission_name(model, verb) for verb in verbs) if name not in names]
+        existing = set(Permission.objects.filter(permission_name__in=names).values_list('permission_name', flat=True))
+        Permission.objects.bulk_create([Permission(permission_name=name) for name in names if name not in existing])
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(names) - len(existing)} permissions created, {len(existing)} already present'
+        ))
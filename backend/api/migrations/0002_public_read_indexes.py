@@ -0,0 +1,61 @@
+# Generated by Django 5.2.8 on 2026-10-18 13:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='documents',
+            index=models.Index(fields=['category', '-doc_id'], name='documents_category_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='feedback',
+            index=models.Index(fields=['status', '-submitted_date', '-feedback_id'], name='feedback_status_submitted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='feedback',
+            index=models.Index(fields=['-submitted_date', '-feedback_id'], name='feedback_submitted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='gallery',
+            index=models.Index(fields=['type', '-upload_date', '-media_id'], name='gallery_type_upload_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='gallery',
+            index=models.Index(fields=['-upload_date', '-media_id'], name='gallery_upload_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='helplinequeries',
+            index=models.Index(fields=['-query_date', '-query_id'], name='helpline_query_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newsandevents',
+            index=models.Index(fields=['type', '-news_event_id'], name='news_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newsandevents',
+            index=models.Index(fields=['type', 'event_date'], name='news_type_event_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notice',
+            index=models.Index(fields=['status', '-publish_date', '-notice_id'], name='notice_status_publish_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notice',
+            index=models.Index(fields=['status', 'expiry_date'], name='notice_status_expiry_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notice',
+            index=models.Index(fields=['-publish_date', '-notice_id'], name='notice_publish_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tender',
+            index=models.Index(fields=['-submission_deadline', '-tender_id'], name='tender_deadline_idx'),
+        ),
+    ]
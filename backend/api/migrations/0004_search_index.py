@@ -0,0 +1,91 @@
+# Generated by Django 5.2.8 on 2026-10-18 13:35
+
+from django.db import migrations, models
+
+
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE api_searchindexentry_fts USING fts5(
+        title, body,
+        content='api_searchindexentry', content_rowid='entry_id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER api_searchindexentry_ai AFTER INSERT ON api_searchindexentry BEGIN
+        INSERT INTO api_searchindexentry_fts(rowid, title, body) VALUES (new.entry_id, new.title, new.body);
+    END
+    """,
+    """
+    CREATE TRIGGER api_searchindexentry_ad AFTER DELETE ON api_searchindexentry BEGIN
+        INSERT INTO api_searchindexentry_fts(api_searchindexentry_fts, rowid, title, body)
+        VALUES ('delete', old.entry_id, old.title, old.body);
+    END
+    """,
+    """
+    CREATE TRIGGER api_searchindexentry_au AFTER UPDATE ON api_searchindexentry BEGIN
+        INSERT INTO api_searchindexentry_fts(api_searchindexentry_fts, rowid, title, body)
+        VALUES ('delete', old.entry_id, old.title, old.body);
+        INSERT INTO api_searchindexentry_fts(rowid, title, body) VALUES (new.entry_id, new.title, new.body);
+    END
+    """,
+]
+
+SQLITE_BACKWARD = [
+    'DROP TRIGGER IF EXISTS api_searchindexentry_au',
+    'DROP TRIGGER IF EXISTS api_searchindexentry_ad',
+    'DROP TRIGGER IF EXISTS api_searchindexentry_ai',
+    'DROP TABLE IF EXISTS api_searchindexentry_fts',
+]
+
+# The 'simple' configuration does no stemming, which is what Hindi content needs.
+POSTGRES_FORWARD = [
+    """
+    ALTER TABLE api_searchindexentry ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(body, '')), 'B')
+    ) STORED
+    """,
+    'CREATE INDEX api_searchindexentry_vector_idx ON api_searchindexentry USING GIN (search_vector)',
+]
+
+POSTGRES_BACKWARD = [
+    'DROP INDEX IF EXISTS api_searchindexentry_vector_idx',
+    'ALTER TABLE api_searchindexentry DROP COLUMN IF EXISTS search_vector',
+]
+
+
+def run_vendor_sql(statements):
+    def run(apps, schema_editor):
+        for statement in statements.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+    return run
+
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_updated_at_timestamps'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchIndexEntry',
+            fields=[
+                ('entry_id', models.AutoField(primary_key=True, serialize=False)),
+                ('content_type', models.CharField(choices=[('notice', 'Notice'), ('tender', 'Tender'), ('news_event', 'News and Events'), ('document', 'Document'), ('scheme_project', 'Scheme or Project')], max_length=20)),
+                ('object_id', models.IntegerField()),
+                ('title', models.CharField(max_length=255)),
+                ('body', models.TextField(blank=True, default='')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'unique_together': {('content_type', 'object_id')},
+            },
+        ),
+        migrations.RunPython(
+            run_vendor_sql({'sqlite': SQLITE_FORWARD, 'postgresql': POSTGRES_FORWARD}),
+            run_vendor_sql({'sqlite': SQLITE_BACKWARD, 'postgresql': POSTGRES_BACKWARD}),
+        ),
+    ]
@@ -0,0 +1,91 @@
+# Generated by Django 5.2.8 on 2026-10-18 13:38
+
+from django.db import migrations, models
+
+
+# Devanagari vowel signs, virama and nasalization marks. unicode61 treats them as
+# separators by default, which splits almost every Hindi word into fragments.
+DEVANAGARI_MARKS = ''.join(map(chr, [*range(0x0900, 0x0904), *range(0x093a, 0x0950), *range(0x0951, 0x0958), 0x0962, 0x0963]))
+
+
+def sqlite_fts(columns, tokenize):
+    column_list = ', '.join(columns)
+    new_values = ', '.join(f'new.{column}' for column in columns)
+    old_values = ', '.join(f'old.{column}' for column in columns)
+    return [
+        'DROP TRIGGER IF EXISTS api_searchindexentry_au',
+        'DROP TRIGGER IF EXISTS api_searchindexentry_ad',
+        'DROP TRIGGER IF EXISTS api_searchindexentry_ai',
+        'DROP TABLE IF EXISTS api_searchindexentry_fts',
+        f"""
+        CREATE VIRTUAL TABLE api_searchindexentry_fts USING fts5(
+            {column_list},
+            content='api_searchindexentry', content_rowid='entry_id',
+            tokenize="{tokenize}"
+        )
+        """,
+        f"""
+        CREATE TRIGGER api_searchindexentry_ai AFTER INSERT ON api_searchindexentry BEGIN
+            INSERT INTO api_searchindexentry_fts(rowid, {column_list}) VALUES (new.entry_id, {new_values});
+        END
+        """,
+        f"""
+        CREATE TRIGGER api_searchindexentry_ad AFTER DELETE ON api_searchindexentry BEGIN
+            INSERT INTO api_searchindexentry_fts(api_searchindexentry_fts, rowid, {column_list})
+            VALUES ('delete', old.entry_id, {old_values});
+        END
+        """,
+        f"""
+        CREATE TRIGGER api_searchindexentry_au AFTER UPDATE ON api_searchindexentry BEGIN
+            INSERT INTO api_searchindexentry_fts(api_searchindexentry_fts, rowid, {column_list})
+            VALUES ('delete', old.entry_id, {old_values});
+            INSERT INTO api_searchindexentry_fts(rowid, {column_list}) VALUES (new.entry_id, {new_values});
+        END
+        """,
+        "INSERT INTO api_searchindexentry_fts(api_searchindexentry_fts) VALUES ('rebuild')",
+    ]
+
+
+SQLITE_FORWARD = sqlite_fts(['title', 'body', 'keys'], f"unicode61 remove_diacritics 0 tokenchars '{DEVANAGARI_MARKS}'")
+SQLITE_BACKWARD = sqlite_fts(['title', 'body'], 'unicode61 remove_diacritics 2')
+
+
+def postgres_vector(with_keys):
+    keys = " || setweight(to_tsvector('simple', coalesce(keys, '')), 'C')" if with_keys else ''
+    return [
+        'DROP INDEX IF EXISTS api_searchindexentry_vector_idx',
+        'ALTER TABLE api_searchindexentry DROP COLUMN IF EXISTS search_vector',
+        f"""
+        ALTER TABLE api_searchindexentry ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('simple', coalesce(body, '')), 'B'){keys}
+        ) STORED
+        """,
+        'CREATE INDEX api_searchindexentry_vector_idx ON api_searchindexentry USING GIN (search_vector)',
+    ]
+
+
+def run_vendor_sql(statements):
+    def run(apps, schema_editor):
+        for statement in statements.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='searchindexentry',
+            name='keys',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.RunPython(
+            run_vendor_sql({'sqlite': SQLITE_FORWARD, 'postgresql': postgres_vector(with_keys=True)}),
+            run_vendor_sql({'sqlite': SQLITE_BACKWARD, 'postgresql': postgres_vector(with_keys=False)}),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.8 on 2026-10-18 13:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_search_index_keys'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='documents',
+            name='file_path',
+            field=models.FileField(max_length=255, upload_to='documents/%Y/%m/'),
+        ),
+        migrations.AlterField(
+            model_name='gallery',
+            name='file_path',
+            field=models.FileField(max_length=255, upload_to='gallery/%Y/%m/'),
+        ),
+        migrations.AlterField(
+            model_name='notice',
+            name='document_file_path',
+            field=models.FileField(blank=True, max_length=255, null=True, upload_to='notices/%Y/%m/'),
+        ),
+        migrations.AlterField(
+            model_name='tender',
+            name='tender_document_path',
+            field=models.FileField(max_length=255, upload_to='tenders/%Y/%m/'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.8 on 2026-10-18 13:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_upload_sessions'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gallery',
+            name='blurhash',
+            field=models.CharField(blank=True, default='', max_length=100),
+        ),
+        migrations.AddField(
+            model_name='gallery',
+            name='height',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='gallery',
+            name='variants',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='gallery',
+            name='width',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+    ]
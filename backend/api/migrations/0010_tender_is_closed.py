@@ -0,0 +1,29 @@
+# Generated by Django 5.2.8 on 2026-10-18 14:27
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def close_past_deadline(apps, schema_editor):
+    Tender = apps.get_model('api', 'Tender')
+    Tender.objects.filter(submission_deadline__lte=timezone.now()).update(is_closed=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_task_queue'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tender',
+            name='is_closed',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name='tender',
+            index=models.Index(condition=models.Q(('is_closed', False)), fields=['-submission_deadline', '-tender_id'], name='tender_open_deadline_idx'),
+        ),
+        migrations.RunPython(close_past_deadline, migrations.RunPython.noop),
+    ]
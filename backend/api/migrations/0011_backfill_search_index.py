@@ -0,0 +1,62 @@
+# Generated by Django 5.2.8 on 2026-10-18 14:49
+
+from django.db import migrations
+
+from api.text import index_keys
+
+
+# A frozen copy of api.search.SOURCES as it stood for this migration:
+# (content type, model, title field, body fields, include).
+SOURCES = [
+    ('notice', 'Notice', 'title', ['content'], lambda notice: notice.status != 'Draft'),
+    ('tender', 'Tender', 'title', ['description'], None),
+    ('news_event', 'NewsAndEvents', 'title', ['body'], None),
+    ('document', 'Documents', 'title', ['category'], None),
+    ('scheme_project', 'SchemesAndProjects', 'name', ['description'], None),
+]
+
+
+def entry_for(instance, title_field, body_fields, include):
+    if include and not include(instance):
+        return None
+    title = getattr(instance, title_field) or ''
+    body = '\n'.join(str(getattr(instance, field)) for field in body_fields if getattr(instance, field))
+    return {'title': title[:255], 'body': body, 'keys': index_keys(title, body)}
+
+
+def backfill(apps, schema_editor):
+    # Rows written before the search index existed have no entries; index them once here
+    # so search works straight after an upgrade. Later writes are indexed by the signals.
+    # Keys still come from api.text: they must match what search queries are normalized
+    # to, and the module only transforms strings, it never touches models.
+    SearchIndexEntry = apps.get_model('api', 'SearchIndexEntry')
+    for content_type, model_name, title_field, body_fields, include in SOURCES:
+        queryset = apps.get_model('api', model_name).objects.order_by('pk')
+        last_pk = None
+        while True:
+            batch = list((queryset if last_pk is None else queryset.filter(pk__gt=last_pk))[:500])
+            if not batch:
+                break
+            last_pk = batch[-1].pk
+            entries = []
+            for instance in batch:
+                entry = entry_for(instance, title_field, body_fields, include)
+                if entry is not None:
+                    entries.append(SearchIndexEntry(content_type=content_type, object_id=instance.pk, **entry))
+            SearchIndexEntry.objects.bulk_create(
+                entries,
+                update_conflicts=True,
+                unique_fields=['content_type', 'object_id'],
+                update_fields=['title', 'body', 'keys', 'updated_at'],
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_tender_is_closed'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
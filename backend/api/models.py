@@ -1,7 +1,9 @@
 from django.db import models
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
 from django.core.validators import MinValueValidator
+from django.utils import timezone
 from decimal import Decimal
+import uuid
 
 class UserManager(BaseUserManager):
     def create_user(self, username, email, password=None, full_name=None):
@@ -69,7 +71,8 @@ class User(AbstractBaseUser, PermissionsMixin):
         return self.username
     
     def has_perm(self, perm, obj=None):
-        return self.is_superuser
+        from .permissions import has_role_permission
+        return has_role_permission(self, perm)
 
     def has_module_perms(self, app_label):
         return self.is_superuser
@@ -108,6 +111,13 @@ class RolePermissions(models.Model):
     def __str__(self):
         return f"{self.role.role_name} - {self.permission.permission_name}"
 
+class NoticeQuerySet(models.QuerySet):
+    def active(self, now=None):
+        now = now or timezone.now()
+        return self.filter(status='Published', publish_date__lte=now).filter(
+            models.Q(expiry_date__isnull=True) | models.Q(expiry_date__gt=now)
+        )
+
 class Notice(models.Model):
     STATUS_CHOICES = [
         ('Draft', 'Draft'),
@@ -120,20 +130,49 @@ class Notice(models.Model):
     content = models.TextField(blank=True, null=True)
     publish_date = models.DateTimeField(null=False)
     expiry_date = models.DateTimeField(blank=True, null=True)
-    document_file_path = models.CharField(max_length=255, blank=True, null=True)
+    document_file_path = models.FileField(upload_to='notices/%Y/%m/', max_length=255, blank=True, null=True)
     created_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='notices')
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='Draft')
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    objects = NoticeQuerySet.as_manager()
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', '-publish_date', '-notice_id'], name='notice_status_publish_idx'),
+            models.Index(fields=['status', 'expiry_date'], name='notice_status_expiry_idx'),
+            models.Index(fields=['-publish_date', '-notice_id'], name='notice_publish_idx'),
+        ]
     
     def __str__(self):
         return self.title
 
+class TenderQuerySet(models.QuerySet):
+    def active(self, now=None):
+        # The deadline check still applies to tenders that closed since archive_content last ran.
+        return self.filter(is_closed=False, submission_deadline__gt=now or timezone.now())
+
 class Tender(models.Model):
     tender_id = models.AutoField(primary_key=True)
     title = models.CharField(max_length=255, null=False)
     description = models.TextField(blank=True, null=True)
-    tender_document_path = models.CharField(max_length=255, null=False)
+    tender_document_path = models.FileField(upload_to='tenders/%Y/%m/', max_length=255, null=False)
     submission_deadline = models.DateTimeField(null=False)
     opening_date = models.DateTimeField(blank=True, null=True)
+    is_closed = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    objects = TenderQuerySet.as_manager()
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['-submission_deadline', '-tender_id'], name='tender_deadline_idx'),
+            models.Index(
+                fields=['-submission_deadline', '-tender_id'],
+                condition=models.Q(is_closed=False),
+                name='tender_open_deadline_idx',
+            ),
+        ]
     
     def __str__(self):
         return self.title
@@ -151,6 +190,13 @@ class NewsAndEvents(models.Model):
     event_date = models.DateField(blank=True, null=True)
     type = models.CharField(max_length=20, choices=TYPE_CHOICES, null=False)
     created_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='news_events')
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['type', '-news_event_id'], name='news_type_idx'),
+            models.Index(fields=['type', 'event_date'], name='news_type_event_date_idx'),
+        ]
     
     def __str__(self):
         return self.title
@@ -163,9 +209,20 @@ class Gallery(models.Model):
     
     media_id = models.AutoField(primary_key=True)
     caption = models.CharField(max_length=255, blank=True, null=True)
-    file_path = models.CharField(max_length=255, null=False)
+    file_path = models.FileField(upload_to='gallery/%Y/%m/', max_length=255, null=False)
     type = models.CharField(max_length=10, choices=TYPE_CHOICES, null=False)
+    width = models.PositiveIntegerField(blank=True, null=True)
+    height = models.PositiveIntegerField(blank=True, null=True)
+    variants = models.JSONField(default=list, blank=True)
+    blurhash = models.CharField(max_length=100, blank=True, default='')
     upload_date = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['type', '-upload_date', '-media_id'], name='gallery_type_upload_idx'),
+            models.Index(fields=['-upload_date', '-media_id'], name='gallery_upload_idx'),
+        ]
     
     def __str__(self):
         return self.caption or f"Media {self.media_id}"
@@ -174,8 +231,14 @@ class Documents(models.Model):
     doc_id = models.AutoField(primary_key=True)
     title = models.CharField(max_length=255, null=False)
     category = models.CharField(max_length=100, blank=True, null=True)
-    file_path = models.CharField(max_length=255, null=False)
+    file_path = models.FileField(upload_to='documents/%Y/%m/', max_length=255, null=False)
     uploaded_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='documents')
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['category', '-doc_id'], name='documents_category_idx'),
+        ]
     
     def __str__(self):
         return self.title
@@ -193,6 +256,7 @@ class SchemesAndProjects(models.Model):
     end_date = models.DateField(blank=True, null=True)
     budget = models.DecimalField(max_digits=15, decimal_places=2, blank=True, null=True, validators=[MinValueValidator(Decimal('0.00'))])
     type = models.CharField(max_length=10, choices=TYPE_CHOICES, null=False)
+    updated_at = models.DateTimeField(auto_now=True)
     
     def __str__(self):
         return self.name
@@ -214,6 +278,12 @@ class Feedback(models.Model):
     submitted_date = models.DateTimeField(auto_now_add=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='New')
     
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', '-submitted_date', '-feedback_id'], name='feedback_status_submitted_idx'),
+            models.Index(fields=['-submitted_date', '-feedback_id'], name='feedback_submitted_idx'),
+        ]
+    
     def __str__(self):
         return self.subject
 
@@ -225,5 +295,86 @@ class HelpLineQueries(models.Model):
     query_date = models.DateTimeField(auto_now_add=True)
     assigned_to = models.ForeignKey(User, on_delete=models.SET_NULL, blank=True, null=True, related_name='assigned_queries')
     
+    class Meta:
+        indexes = [
+            models.Index(fields=['-query_date', '-query_id'], name='helpline_query_date_idx'),
+        ]
+    
+    def __str__(self):
+        return self.title or f"Query {self.query_id}"
+
+class SearchIndexEntry(models.Model):
+    CONTENT_TYPE_CHOICES = [
+        ('notice', 'Notice'),
+        ('tender', 'Tender'),
+        ('news_event', 'News and Events'),
+        ('document', 'Document'),
+        ('scheme_project', 'Scheme or Project'),
+    ]
+    
+    entry_id = models.AutoField(primary_key=True)
+    content_type = models.CharField(max_length=20, choices=CONTENT_TYPE_CHOICES, null=False)
+    object_id = models.IntegerField(null=False)
+    title = models.CharField(max_length=255, null=False)
+    body = models.TextField(blank=True, default='')
+    keys = models.TextField(blank=True, default='')  # Normalized, skeleton and transliterated tokens, see api/text.py
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        unique_together = ('content_type', 'object_id')
+    
+    def __str__(self):
+        return f"{self.content_type} {self.object_id}: {self.title}"
+
+class UploadSession(models.Model):
+    TARGET_CHOICES = [
+        ('gallery', 'Gallery'),
+        ('tender', 'Tender'),
+    ]
+    STATUS_CHOICES = [
+        ('Pending', 'Pending'),
+        ('Complete', 'Complete'),
+    ]
+    
+    upload_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    target = models.CharField(max_length=20, choices=TARGET_CHOICES, null=False)
+    filename = models.CharField(max_length=255, null=False)
+    total_size = models.BigIntegerField(null=False)
+    received_bytes = models.BigIntegerField(default=0)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='Pending')
+    created_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='upload_sessions')
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    def __str__(self):
+        return f"{self.filename} ({self.received_bytes}/{self.total_size})"
+
+class Task(models.Model):
+    STATUS_CHOICES = [
+        ('Queued', 'Queued'),
+        ('Running', 'Running'),
+        ('Succeeded', 'Succeeded'),
+        ('Failed', 'Failed'),
+    ]
+    
+    task_id = models.AutoField(primary_key=True)
+    name = models.CharField(max_length=100, null=False)
+    args = models.JSONField(default=list, blank=True)
+    kwargs = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='Queued')
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=3)
+    run_at = models.DateTimeField(default=timezone.now)
+    locked_by = models.CharField(max_length=100, blank=True, default='')
+    locked_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'run_at', 'task_id'], name='task_status_run_at_idx'),
+        ]
+    
     def __str__(self):
-        return self.title or f"Query {self.query_id}"
\ No newline at end of file
+        return f"{self.name} #{self.task_id} ({self.status})"
@@ -0,0 +1,32 @@
+from django.core.mail import send_mail
+
+from .models import Feedback, User
+from .tasks import task
+
+
+@task(max_attempts=5, retry_delay=60)
+def send_welcome_email(user_id):
+    user = User.objects.filter(pk=user_id).first()
+    if user is None or not user.email:
+        return
+    send_mail(
+        'Welcome to the Nagar Panchayat Ukhimath portal',
+        f'Namaste {user.full_name or user.username},\n\nYour account "{user.username}" has been created.',
+        None,
+        [user.email],
+    )
+
+
+@task(max_attempts=5, retry_delay=60)
+def send_feedback_acknowledgement(feedback_id):
+    feedback = Feedback.objects.filter(pk=feedback_id).first()
+    if feedback is None or not feedback.citizen_email:
+        return
+    send_mail(
+        f'We received your feedback: {feedback.subject}',
+        f'Namaste {feedback.citizen_name or "citizen"},\n\n'
+        f'Thank you for writing to Nagar Panchayat Ukhimath. Your feedback is registered '
+        f'as #{feedback.feedback_id} and will be reviewed by our staff.',
+        None,
+        [feedback.citizen_email],
+    )
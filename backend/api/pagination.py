@@ -0,0 +1,17 @@
+from rest_framework.pagination import CursorPagination
+
+
+class PortalCursorPagination(CursorPagination):
+    # Keyset pagination: each page is a `WHERE key < last_seen ORDER BY key LIMIT n`
+    # query, so fetching page 500 costs the same as fetching page 1. Every list is paged,
+    # PAGE_SIZE rows by default and at most `max_page_size` with `?page_size=`, so no
+    # request reads a whole table.
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = '-pk'
+
+    def get_ordering(self, request, queryset, view):
+        # Viewsets declare their natural key with `cursor_ordering`. The first
+        # field is the cursor position; later fields only make ties deterministic.
+        self.ordering = getattr(view, 'cursor_ordering', self.ordering)
+        return super().get_ordering(request, queryset, view)
@@ -0,0 +1,77 @@
+from rest_framework import permissions
+
+from .cache import get_cache, get_timeout, get_versions
+from .models import Permission, Role, RolePermissions, UserRoles
+
+# Write actions map to Permission rows named "<model>.<verb>_<model>" (e.g.
+# "notice.change_notice"), the "<module>.<name>" shape the roles admin page groups by.
+ACTION_VERBS = {
+    'create': 'add',
+    'update': 'change',
+    'partial_update': 'change',
+    'destroy': 'delete',
+    'bulk_create': 'add',
+    'bulk_update': 'change',
+    'bulk_destroy': 'delete',
+    # Exports stream every row, personal details included, so they get their own grant.
+    'export': 'export',
+}
+VERBS = ('add', 'change', 'delete')
+RBAC_MODELS = (Role, Permission, UserRoles, RolePermissions)
+
+
+def permission_name(model, verb):
+    name = model._meta.model_name
+    return f'{name}.{verb}_{name}'
+
+
+def get_role_permissions(user):
+    """
+    The permission names granted to `user` through their roles. They are resolved with
+    one query and cached under the current generation of the RBAC tables, in the shared
+    cache and on the user object. Any change to roles or grants bumps the generation,
+    so the next check sees it without explicit invalidation.
+    """
+    if not user or not user.is_authenticated:
+        return frozenset()
+    versions = tuple(get_versions(RBAC_MODELS))
+    memo = getattr(user, '_role_permissions', None)
+    if memo is not None and memo[0] == versions:
+        return memo[1]
+
+    cache = get_cache()
+    key = f"rbac:{user.pk}:{'.'.join(map(str, versions))}"
+    names = cache.get(key)
+    if names is None:
+        names = frozenset(
+            Permission.objects.filter(rolepermissions__role__userroles__user=user)
+            .values_list('permission_name', flat=True)
+            .distinct()
+        )
+        cache.set(key, names, get_timeout())
+    user._role_permissions = (versions, names)
+    return names
+
+
+def has_role_permission(user, name):
+    if not user or not user.is_authenticated or not user.is_active:
+        return False
+    return user.is_superuser or name in get_role_permissions(user)
+
+
+class HasRolePermission(permissions.BasePermission):
+    """
+    Requires the role permission matching the view's model and write or export action.
+    Reads and other custom actions pass through, so combine it with the view's usual
+    permission classes.
+    """
+    message = 'Your role does not allow this action.'
+
+    def has_permission(self, request, view):
+        verb = ACTION_VERBS.get(getattr(view, 'action', None))
+        if verb is None:
+            return True
+        model = getattr(getattr(view, 'queryset', None), 'model', None)
+        if model is None:
+            return True
+        return has_role_permission(request.user, permission_name(model, verb))
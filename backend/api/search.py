@@ -0,0 +1,197 @@
+from django.db import connection
+from django.db.models import Q
+
+from . import text
+from .models import Documents, NewsAndEvents, Notice, SchemesAndProjects, SearchIndexEntry, Tender
+
+
+class SearchSource:
+    """Describes how rows of one content model are flattened into the search index."""
+
+    def __init__(self, content_type, model, prefix, title, body, include=None):
+        self.content_type = content_type
+        self.model = model
+        self.prefix = prefix
+        self.title = title
+        self.body = body
+        self.include = include
+
+    def entry_for(self, instance):
+        if self.include and not self.include(instance):
+            return None
+        title = getattr(instance, self.title) or ''
+        body = '\n'.join(str(getattr(instance, field)) for field in self.body if getattr(instance, field))
+        return {'title': title[:255], 'body': body, 'keys': text.index_keys(title, body)}
+
+
+SOURCES = [
+    SearchSource('notice', Notice, 'notices', 'title', ['content'], include=lambda notice: notice.status != 'Draft'),
+    SearchSource('tender', Tender, 'tenders', 'title', ['description']),
+    SearchSource('news_event', NewsAndEvents, 'news-events', 'title', ['body']),
+    SearchSource('document', Documents, 'documents', 'title', ['category']),
+    SearchSource('scheme_project', SchemesAndProjects, 'schemes-projects', 'name', ['description']),
+]
+
+SOURCES_BY_MODEL = {source.model: source for source in SOURCES}
+SOURCES_BY_TYPE = {source.content_type: source for source in SOURCES}
+
+
+def index_instance(instance):
+    source = SOURCES_BY_MODEL[type(instance)]
+    entry = source.entry_for(instance)
+    if entry is None:
+        remove_instance(instance)
+        return
+    SearchIndexEntry.objects.update_or_create(
+        content_type=source.content_type,
+        object_id=instance.pk,
+        defaults=entry,
+    )
+
+
+def remove_instance(instance):
+    source = SOURCES_BY_MODEL[type(instance)]
+    SearchIndexEntry.objects.filter(content_type=source.content_type, object_id=instance.pk).delete()
+
+
+def index_instances(model, instances):
+    """`index_instance` for many rows of one model, with one upsert and one delete."""
+    source = SOURCES_BY_MODEL[model]
+    entries, excluded = [], []
+    for instance in instances:
+        entry = source.entry_for(instance)
+        if entry is None:
+            excluded.append(instance.pk)
+        else:
+            entries.append(SearchIndexEntry(content_type=source.content_type, object_id=instance.pk, **entry))
+    if entries:
+        SearchIndexEntry.objects.bulk_create(
+            entries,
+            update_conflicts=True,
+            unique_fields=['content_type', 'object_id'],
+            update_fields=['title', 'body', 'keys', 'updated_at'],
+        )
+    if excluded:
+        remove_instances(model, excluded)
+
+
+def remove_instances(model, pks):
+    source = SOURCES_BY_MODEL[model]
+    SearchIndexEntry.objects.filter(content_type=source.content_type, object_id__in=pks).delete()
+
+
+def tokenize_query(query):
+    """One list of alternative forms per query word, see `text.token_forms`."""
+    return [text.token_forms(token) for token in text.tokenize(query)]
+
+
+def search(query, content_types=None, limit=20, offset=0):
+    """
+    Ranked hits across every content type in one query. Returns `(total, hits)`,
+    where `total` is the number of matches before `limit`/`offset` are applied.
+    """
+    tokens = tokenize_query(query)
+    if not tokens:
+        return 0, []
+    backend = {
+        'sqlite': _search_sqlite,
+        'postgresql': _search_postgresql,
+    }.get(connection.vendor, _search_fallback)
+    rows = backend(tokens, content_types or [], limit, offset)
+    total = rows[0][-1] if rows else 0
+    return total, [_hit(*row[:-1]) for row in rows]
+
+
+def _hit(content_type, object_id, title, snippet, rank):
+    prefix = SOURCES_BY_TYPE[content_type].prefix
+    return {
+        'type': content_type,
+        'id': object_id,
+        'title': title,
+        'snippet': snippet,
+        'rank': rank,
+        'url': f'/api/{prefix}/{object_id}/',
+    }
+
+
+def _type_clause(column, content_types, params):
+    if not content_types:
+        return ''
+    params.extend(content_types)
+    return f' AND {column} IN ({", ".join(["%s"] * len(content_types))})'
+
+
+def _search_sqlite(tokens, content_types, limit, offset):
+    # Every word must match under one of its forms; the last word also matches as a
+    # prefix so results appear while the user is still typing.
+    terms = []
+    for position, forms in enumerate(tokens, start=1):
+        suffix = '*' if position == len(tokens) else ''
+        terms.append('(' + ' OR '.join('"{}"{}'.format(form.replace('"', '""'), suffix) for form in forms) + ')')
+    match = ' AND '.join(terms)
+    params = [match]
+    type_clause = _type_clause('e.content_type', content_types, params)
+    params += [limit, offset, match]
+    # bm25() and snippet() cannot share a SELECT with a window function, so rank
+    # first, page the ranked rows, and only then build snippets for that page.
+    sql = f"""
+        WITH hits AS (
+            SELECT rowid AS entry_id, -bm25(api_searchindexentry_fts, 10.0, 2.0, 1.0) AS rank
+            FROM api_searchindexentry_fts
+            WHERE api_searchindexentry_fts MATCH %s
+        ), page AS (
+            SELECT e.entry_id, e.content_type, e.object_id, e.title, hits.rank, COUNT(*) OVER () AS total
+            FROM hits
+            JOIN api_searchindexentry e ON e.entry_id = hits.entry_id
+            WHERE 1 = 1{type_clause}
+            ORDER BY hits.rank DESC
+            LIMIT %s OFFSET %s
+        )
+        SELECT page.content_type, page.object_id, page.title,
+               (SELECT snippet(api_searchindexentry_fts, 1, '<mark>', '</mark>', '…', 16)
+                FROM api_searchindexentry_fts
+                WHERE api_searchindexentry_fts MATCH %s AND rowid = page.entry_id),
+               page.rank, page.total
+        FROM page
+        ORDER BY page.rank DESC
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+
+
+def _search_postgresql(tokens, content_types, limit, offset):
+    terms = []
+    for position, forms in enumerate(tokens, start=1):
+        suffix = ':*' if position == len(tokens) else ''
+        terms.append('(' + ' | '.join("'{}'{}".format(form.replace("'", "''"), suffix) for form in forms) + ')')
+    params = [' & '.join(terms)]
+    type_clause = _type_clause('content_type', content_types, params)
+    params += [limit, offset]
+    sql = f"""
+        SELECT content_type, object_id, title,
+               ts_headline('simple', body, query, 'StartSel=<mark>, StopSel=</mark>, MaxWords=24, MinWords=8'),
+               ts_rank(search_vector, query) AS rank,
+               COUNT(*) OVER ()
+        FROM api_searchindexentry, to_tsquery('simple', %s) query
+        WHERE search_vector @@ query{type_clause}
+        ORDER BY rank DESC
+        LIMIT %s OFFSET %s
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+
+
+def _search_fallback(tokens, content_types, limit, offset):
+    queryset = SearchIndexEntry.objects.all()
+    for forms in tokens:
+        match = Q()
+        for form in forms:
+            match |= Q(keys__icontains=form)
+        queryset = queryset.filter(match)
+    if content_types:
+        queryset = queryset.filter(content_type__in=content_types)
+    total = queryset.count()
+    rows = queryset.order_by('-updated_at').values_list('content_type', 'object_id', 'title', 'body')[offset:offset + limit]
+    return [(content_type, object_id, title, body[:200], None, total) for content_type, object_id, title, body in rows]
@@ -1,7 +1,33 @@
 from rest_framework import serializers
+from rest_framework.fields import SkipField, empty
 from django.contrib.auth.hashers import make_password
 from .models import *
 from django.contrib.auth import authenticate
+from django.urls import reverse
+from django.utils import timezone
+from . import uploads
+
+
+class DownloadFileField(serializers.FileField):
+    """
+    Accepts an uploaded file, and renders the relative URL of the resource's streaming
+    download endpoint rather than a storage URL, so files are never served from MEDIA_URL.
+    """
+
+    def __init__(self, url_name, **kwargs):
+        self.url_name = url_name
+        super().__init__(**kwargs)
+
+    def validate_empty_values(self, data):
+        # Updating a row without uploading a new file keeps the stored one.
+        if data in (empty, '') and self.parent is not None and self.parent.instance is not None:
+            raise SkipField()
+        return super().validate_empty_values(data)
+
+    def to_representation(self, value):
+        if not value:
+            return None
+        return reverse(self.url_name, args=[value.instance.pk])
 
 
 class LoginSerializer(serializers.Serializer):
@@ -143,15 +169,33 @@ class RolePermissionsSerializer(serializers.ModelSerializer):
 
 class NoticeSerializer(serializers.ModelSerializer):
     created_by = UserSerializer(read_only=True)
+    document_file_path = DownloadFileField('notice-download', required=False, allow_null=True)
     
     class Meta:
         model = Notice
         fields = '__all__'
 
+class NoticeSummarySerializer(NoticeSerializer):
+    class Meta(NoticeSerializer.Meta):
+        fields = ['notice_id', 'title', 'publish_date', 'expiry_date', 'status', 'document_file_path', 'updated_at']
+
 class TenderSerializer(serializers.ModelSerializer):
+    tender_document_path = DownloadFileField('tender-download')
+    
     class Meta:
         model = Tender
         fields = '__all__'
+        read_only_fields = ['is_closed']
+
+    def validate(self, data):
+        # archive_content closes tenders as deadlines pass; a moved deadline takes effect now.
+        if 'submission_deadline' in data:
+            data['is_closed'] = data['submission_deadline'] <= timezone.now()
+        return data
+
+class TenderSummarySerializer(TenderSerializer):
+    class Meta(TenderSerializer.Meta):
+        fields = ['tender_id', 'title', 'tender_document_path', 'submission_deadline', 'opening_date', 'is_closed', 'updated_at']
 
 class NewsAndEventsSerializer(serializers.ModelSerializer):
     created_by = UserSerializer(read_only=True)
@@ -160,23 +204,51 @@ class NewsAndEventsSerializer(serializers.ModelSerializer):
         model = NewsAndEvents
         fields = '__all__'
 
+class NewsAndEventsSummarySerializer(NewsAndEventsSerializer):
+    class Meta(NewsAndEventsSerializer.Meta):
+        fields = ['news_event_id', 'title', 'event_date', 'type', 'updated_at']
+
 class GallerySerializer(serializers.ModelSerializer):
+    file_path = DownloadFileField('gallery-download')
+    srcset = serializers.SerializerMethodField()
+    field_dependencies = {'srcset': ['variants']}
+    
     class Meta:
         model = Gallery
         fields = '__all__'
+        read_only_fields = ['width', 'height', 'variants', 'blurhash']
+
+    def get_srcset(self, obj):
+        return ', '.join(
+            f"{reverse('gallery-variant', args=[obj.pk, variant['width']])} {variant['width']}w"
+            for variant in obj.variants or []
+        )
+
+class GallerySummarySerializer(GallerySerializer):
+    class Meta(GallerySerializer.Meta):
+        fields = ['media_id', 'caption', 'file_path', 'type', 'width', 'height', 'blurhash', 'srcset', 'upload_date']
 
 class DocumentsSerializer(serializers.ModelSerializer):
     uploaded_by = UserSerializer(read_only=True)
+    file_path = DownloadFileField('documents-download')
     
     class Meta:
         model = Documents
         fields = '__all__'
 
+class DocumentsSummarySerializer(DocumentsSerializer):
+    class Meta(DocumentsSerializer.Meta):
+        fields = ['doc_id', 'title', 'category', 'file_path', 'updated_at']
+
 class SchemesAndProjectsSerializer(serializers.ModelSerializer):
     class Meta:
         model = SchemesAndProjects
         fields = '__all__'
 
+class SchemesAndProjectsSummarySerializer(SchemesAndProjectsSerializer):
+    class Meta(SchemesAndProjectsSerializer.Meta):
+        fields = ['sp_id', 'name', 'type', 'start_date', 'end_date', 'budget', 'updated_at']
+
 class FeedbackSerializer(serializers.ModelSerializer):
     citizen_user = UserSerializer(read_only=True)
     
@@ -184,9 +256,31 @@ class FeedbackSerializer(serializers.ModelSerializer):
         model = Feedback
         fields = '__all__'
 
+class FeedbackSummarySerializer(FeedbackSerializer):
+    class Meta(FeedbackSerializer.Meta):
+        fields = ['feedback_id', 'subject', 'citizen_name', 'submitted_date', 'status']
+
 class HelpLineQueriesSerializer(serializers.ModelSerializer):
     assigned_to = UserSerializer(read_only=True)
     
     class Meta:
         model = HelpLineQueries
-        fields = '__all__'
\ No newline at end of file
+        fields = '__all__'
+
+class HelpLineQueriesSummarySerializer(HelpLineQueriesSerializer):
+    class Meta(HelpLineQueriesSerializer.Meta):
+        fields = ['query_id', 'title', 'contact_number', 'query_date']
+
+class UploadSessionSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = UploadSession
+        fields = ['upload_id', 'target', 'filename', 'total_size', 'received_bytes', 'status', 'created_at', 'updated_at']
+        read_only_fields = ['received_bytes', 'status']
+
+    def validate_total_size(self, value):
+        limit = uploads.max_upload_size()
+        if value < 1:
+            raise serializers.ValidationError('Upload size must be positive.')
+        if value > limit:
+            raise serializers.ValidationError(f'Uploads may be at most {limit} bytes.')
+        return value
@@ -0,0 +1,62 @@
+from django.apps import apps
+from django.db.models.signals import post_delete, post_save
+from rest_framework.authtoken.models import Token
+
+from . import images, search
+from .authentication import revoke_cached_tokens
+from .cache import invalidate
+from .models import Gallery, User
+
+
+def invalidate_on_save(sender, instance, update_fields=None, **kwargs):
+    # Logging in only touches last_login, which no cached response renders.
+    if update_fields is not None and set(update_fields) <= {'last_login'}:
+        return
+    invalidate(sender)
+
+
+def invalidate_on_delete(sender, instance, **kwargs):
+    invalidate(sender)
+
+
+def index_on_save(sender, instance, raw=False, **kwargs):
+    if not raw:
+        search.index_instance(instance)
+
+
+def unindex_on_delete(sender, instance, **kwargs):
+    search.remove_instance(instance)
+
+
+def process_gallery_on_save(sender, instance, raw=False, **kwargs):
+    if raw or instance.type != 'Photo' or not instance.file_path or images.has_current_variants(instance):
+        return
+    images.process_gallery.enqueue(instance.pk)
+
+
+def delete_gallery_variants(sender, instance, **kwargs):
+    images.delete_variants(instance.file_path.storage, instance.variants)
+
+
+def revoke_tokens_on_user_save(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and set(update_fields) <= {'last_login'}:
+        return
+    revoke_cached_tokens(instance.pk)
+
+
+def revoke_tokens_on_delete(sender, instance, **kwargs):
+    revoke_cached_tokens(instance.pk if sender is User else instance.user_id)
+
+
+def connect():
+    for model in apps.get_app_config('api').get_models():
+        post_save.connect(invalidate_on_save, sender=model, dispatch_uid=f'response-cache-save:{model._meta.label_lower}')
+        post_delete.connect(invalidate_on_delete, sender=model, dispatch_uid=f'response-cache-delete:{model._meta.label_lower}')
+    for source in search.SOURCES:
+        post_save.connect(index_on_save, sender=source.model, dispatch_uid=f'search-index-save:{source.content_type}')
+        post_delete.connect(unindex_on_delete, sender=source.model, dispatch_uid=f'search-index-delete:{source.content_type}')
+    post_save.connect(process_gallery_on_save, sender=Gallery, dispatch_uid='gallery-variants-save')
+    post_delete.connect(delete_gallery_variants, sender=Gallery, dispatch_uid='gallery-variants-delete')
+    post_save.connect(revoke_tokens_on_user_save, sender=User, dispatch_uid='auth-token-user-save')
+    post_delete.connect(revoke_tokens_on_delete, sender=User, dispatch_uid='auth-token-user-delete')
+    post_delete.connect(revoke_tokens_on_delete, sender=Token, dispatch_uid='auth-token-delete')
@@ -0,0 +1,132 @@
+import logging
+import os
+import socket
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Task
+
+logger = logging.getLogger(__name__)
+
+# Background work for things that should not hold up a request (mail, media processing).
+# Functions decorated with @task are queued with `.enqueue(*args, **kwargs)`:
+#
+#   TASKS_BACKEND = 'database'  a Task row is written in the caller's transaction and
+#                               picked up by `manage.py run_worker`
+#   TASKS_BACKEND = 'memory'    no table and no worker: the task runs in-process once the
+#                               caller's transaction commits (development and tests)
+#
+# Arguments are stored as JSON, so pass primary keys rather than model instances.
+
+REGISTRY = {}
+
+
+class TaskFunction:
+    def __init__(self, func, name, max_attempts, retry_delay):
+        self.func = func
+        self.name = name
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.__doc__ = func.__doc__
+
+    def __call__(self, *args, **kwargs):
+        return self.func(*args, **kwargs)
+
+    def __repr__(self):
+        return f'<task {self.name}>'
+
+    def enqueue(self, *args, **kwargs):
+        if get_backend() == 'memory':
+            transaction.on_commit(lambda: run_in_memory(self, args, kwargs))
+            return None
+        return Task.objects.create(name=self.name, args=list(args), kwargs=kwargs, max_attempts=self.max_attempts)
+
+    def retry_at(self, attempts, now=None):
+        # Exponential backoff: retry_delay, then twice that, four times, ...
+        return (now or timezone.now()) + timedelta(seconds=self.retry_delay * 2 ** max(attempts - 1, 0))
+
+
+def task(name=None, max_attempts=3, retry_delay=30):
+    def register(func):
+        task_function = TaskFunction(func, name or f'{func.__module__}.{func.__name__}', max_attempts, retry_delay)
+        REGISTRY[task_function.name] = task_function
+        return task_function
+    return register
+
+
+def get_backend():
+    backend = getattr(settings, 'TASKS_BACKEND', 'database')
+    if backend not in ('database', 'memory'):
+        raise ValueError(f'Unknown TASKS_BACKEND: {backend!r}')
+    return backend
+
+
+def run_in_memory(task_function, args, kwargs):
+    for attempt in range(1, task_function.max_attempts + 1):
+        try:
+            task_function(*args, **kwargs)
+            return
+        except Exception:
+            logger.exception('Task %s failed (attempt %s of %s)', task_function.name, attempt, task_function.max_attempts)
+
+
+def worker_name():
+    return f'{socket.gethostname()}:{os.getpid()}'
+
+
+def claim(worker, limit):
+    """Mark up to `limit` due tasks as Running for `worker` and return them."""
+    now = timezone.now()
+    with transaction.atomic():
+        # On PostgreSQL, SKIP LOCKED lets several workers claim disjoint batches; on SQLite
+        # the IMMEDIATE transaction already serializes claims between processes.
+        task_ids = list(
+            Task.objects.select_for_update(skip_locked=True)
+            .filter(status='Queued', run_at__lte=now)
+            .order_by('run_at', 'task_id')
+            .values_list('task_id', flat=True)[:limit]
+        )
+        if not task_ids:
+            return []
+        Task.objects.filter(task_id__in=task_ids, status='Queued').update(
+            status='Running', locked_by=worker, locked_at=now, attempts=F('attempts') + 1, updated_at=now,
+        )
+    return list(Task.objects.filter(task_id__in=task_ids, locked_by=worker, status='Running').order_by('run_at', 'task_id'))
+
+
+def execute(task_row):
+    """Run one claimed task and record the outcome. Returns the final status."""
+    task_function = REGISTRY.get(task_row.name)
+    if task_function is None:
+        return _finish(task_row, 'Failed', f'Unknown task {task_row.name!r}', timezone.now())
+    try:
+        task_function(*task_row.args, **task_row.kwargs)
+    except Exception:
+        logger.warning('Task %s #%s failed (attempt %s of %s)', task_row.name, task_row.task_id, task_row.attempts, task_row.max_attempts)
+        error = traceback.format_exc()
+        now = timezone.now()
+        if task_row.attempts < task_row.max_attempts:
+            return _finish(task_row, 'Queued', error, now, run_at=task_function.retry_at(task_row.attempts, now))
+        return _finish(task_row, 'Failed', error, now)
+    return _finish(task_row, 'Succeeded', '', timezone.now())
+
+
+def _finish(task_row, status, error, now, run_at=None):
+    changes = {'status': status, 'last_error': error, 'locked_by': '', 'locked_at': None, 'updated_at': now}
+    if run_at is not None:
+        changes['run_at'] = run_at
+    Task.objects.filter(task_id=task_row.task_id).update(**changes)
+    return status
+
+
+def requeue_stale(timeout):
+    """Hand tasks held by a worker that died mid-run back to the queue."""
+    cutoff = timezone.now() - timedelta(seconds=timeout)
+    return Task.objects.filter(status='Running', locked_at__lt=cutoff).update(
+        status='Queued', locked_by='', locked_at=None, updated_at=timezone.now(),
+    )
@@ -0,0 +1,131 @@
+import functools
+import re
+import unicodedata
+
+# Text normalization for search. Every string that goes into the search index and every
+# query is passed through the same pipeline, so spelling variants meet on the same keys:
+#
+#   normalize()      NFKD, drop the nukta and Latin accents, re-compose, case-fold
+#   skeleton()       Devanagari consonant skeleton: matras, virama and anusvara removed
+#   transliterate()  Devanagari to plain Latin, so "jal" finds "जल"
+#   phonetic_key()   folds common romanization variants ("paani", "pani")
+
+NUKTA = '\u093c'
+CHANDRABINDU = '\u0901'
+ANUSVARA = '\u0902'
+VISARGA = '\u0903'
+VIRAMA = '\u094d'
+
+DEVANAGARI = re.compile(r'[\u0900-\u097f]')
+# Word characters plus Devanagari marks, which \w does not cover; dandas separate words.
+TOKEN = re.compile(r'[\w\u0900-\u0963\u0966-\u096f\u0971-\u097f]+')
+
+# Dependent vowel signs, virama and nasalization marks: everything skeleton() drops.
+SKELETON_DROP = dict.fromkeys(
+    [*range(0x0900, 0x0904), *range(0x093a, 0x0950), *range(0x0955, 0x0958), 0x0962, 0x0963]
+)
+# Long independent vowels fold to their short counterparts.
+SKELETON_VOWELS = str.maketrans('आईऊॠऐऔ', 'अइउऋएओ')
+
+CONSONANTS = {
+    'क': 'k', 'ख': 'kh', 'ग': 'g', 'घ': 'gh', 'ङ': 'n',
+    'च': 'ch', 'छ': 'chh', 'ज': 'j', 'झ': 'jh', 'ञ': 'n',
+    'ट': 't', 'ठ': 'th', 'ड': 'd', 'ढ': 'dh', 'ण': 'n',
+    'त': 't', 'थ': 'th', 'द': 'd', 'ध': 'dh', 'न': 'n',
+    'प': 'p', 'फ': 'ph', 'ब': 'b', 'भ': 'bh', 'म': 'm',
+    'य': 'y', 'र': 'r', 'ल': 'l', 'ळ': 'l', 'व': 'v',
+    'श': 'sh', 'ष': 'sh', 'स': 's', 'ह': 'h',
+}
+VOWELS = {
+    'अ': 'a', 'आ': 'aa', 'इ': 'i', 'ई': 'ee', 'उ': 'u', 'ऊ': 'oo', 'ऋ': 'ri',
+    'ए': 'e', 'ऐ': 'ai', 'ओ': 'o', 'औ': 'au', 'ऑ': 'o',
+}
+MATRAS = {
+    'ा': 'aa', 'ि': 'i', 'ी': 'ee', 'ु': 'u', 'ू': 'oo', 'ृ': 'ri',
+    'े': 'e', 'ै': 'ai', 'ो': 'o', 'ौ': 'au', 'ॉ': 'o',
+}
+NASALS = {ANUSVARA: 'n', CHANDRABINDU: 'n', VISARGA: 'h'}
+
+PHONETIC_RULES = [
+    (re.compile(r'ee|ii'), 'i'),
+    (re.compile(r'oo|uu'), 'u'),
+    (re.compile(r'(.)\1+'), r'\1'),
+    (re.compile(r'ph'), 'f'),
+    (re.compile(r'w'), 'v'),
+]
+
+
+def normalize(text):
+    decomposed = unicodedata.normalize('NFKD', text or '')
+    kept = ''.join(
+        char for char in decomposed
+        if char != NUKTA and (DEVANAGARI.match(char) or not unicodedata.combining(char))
+    )
+    return unicodedata.normalize('NFC', kept).replace(CHANDRABINDU, ANUSVARA).casefold()
+
+
+def tokenize(text):
+    return TOKEN.findall(normalize(text))
+
+
+def is_devanagari(token):
+    return DEVANAGARI.search(token) is not None
+
+
+def skeleton(token):
+    return token.translate(SKELETON_DROP).translate(SKELETON_VOWELS)
+
+
+def transliterate(token):
+    out = []
+    pending_vowel = False
+    for char in token:
+        if char in CONSONANTS:
+            if pending_vowel:
+                out.append('a')
+            out.append(CONSONANTS[char])
+            pending_vowel = True
+        elif char in MATRAS:
+            out.append(MATRAS[char])
+            pending_vowel = False
+        elif char == VIRAMA:
+            pending_vowel = False
+        else:
+            if pending_vowel:
+                out.append('a')
+            pending_vowel = False
+            out.append(VOWELS.get(char) or NASALS.get(char) or (char if char.isascii() else ''))
+    # Hindi drops the inherent vowel at the end of a word (schwa deletion), except in
+    # single-consonant words such as "क".
+    if pending_vowel and len(out) == 1:
+        out.append('a')
+    return ''.join(out)
+
+
+def phonetic_key(latin):
+    for pattern, replacement in PHONETIC_RULES:
+        latin = pattern.sub(replacement, latin)
+    return latin
+
+
+# Indexing calls this once per word of every row, and vocabularies repeat heavily.
+@functools.lru_cache(maxsize=65536)
+def token_forms(token):
+    """All the keys a single normalized token is indexed and searched under."""
+    forms = [token]
+    if is_devanagari(token):
+        forms.append(skeleton(token))
+        latin = transliterate(token)
+        if latin:
+            forms.append(phonetic_key(latin))
+    elif token.isascii():
+        forms.append(phonetic_key(token))
+    return tuple(dict.fromkeys(form for form in forms if form))
+
+
+def index_keys(*texts):
+    keys = {}
+    for text in texts:
+        for token in tokenize(text):
+            keys.update(dict.fromkeys(token_forms(token)))
+    return ' '.join(keys)
@@ -0,0 +1,170 @@
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+# Sliding-window counters: each key keeps a count for the current fixed window and the one
+# before it, and a request is allowed while
+#
+#     previous * (time left of the previous window overlapping now) / window + current <= limit
+#
+# which tracks a true sliding window closely with two integers per key instead of a log
+# of timestamps. Views opt in per action with `throttle_scopes = {'create': 'feedback'}`;
+# the scope's rate limits each client IP, and an optional "<scope>:all" rate caps the
+# endpoint across all clients. A request one client's IP limit already rejected does not
+# count towards the endpoint cap, so no single client can use up everyone's share.
+# Throttles run before the handler, so rejected requests never reach the serializer, the
+# password hasher or the database.
+
+PERIODS = {'s': 1, 'm': 60, 'h': 60 * 60, 'd': 24 * 60 * 60}
+
+
+def parse_rate(rate):
+    """'10/min' -> (10, 60)."""
+    count, period = rate.split('/')
+    return int(count), PERIODS[period[0]]
+
+
+class LocalMemoryStore:
+    """
+    Per-process counters; fine for one worker process or as a first line of defence.
+    Each key remembers when its counts stop mattering (two of its own windows after the
+    current one started), so pruning on behalf of a short scope never drops the counters
+    of a longer one. Once the store grows past `max_keys` it is pruned, and the next
+    prune waits until it has doubled again, so the scan is amortized over many hits.
+    """
+    max_keys = 10000
+
+    def __init__(self):
+        self.counters = {}
+        self.prune_at = self.max_keys
+        self.lock = threading.Lock()
+
+    def hit(self, key, window_start, window):
+        with self.lock:
+            start, current, previous, _ = self.counters.get(key, (window_start, 0, 0, None))
+            if start != window_start:
+                previous = current if start == window_start - window else 0
+                current = 0
+            current += 1
+            self.counters[key] = (window_start, current, previous, window_start + 2 * window)
+            if len(self.counters) > self.prune_at:
+                # No clock of its own: the caller's window start is never later than now.
+                self.prune(window_start)
+            return current, previous
+
+    def prune(self, now):
+        for key in [key for key, (_, _, _, expires) in self.counters.items() if expires <= now]:
+            del self.counters[key]
+        self.prune_at = max(self.max_keys, 2 * len(self.counters))
+
+    def clear(self):
+        with self.lock:
+            self.counters.clear()
+            self.prune_at = self.max_keys
+
+
+class CacheStore:
+    """
+    Counters in a Django cache, shared by every process using that cache. Keys carry a
+    generation so clear() can drop every counter without flushing the rest of the cache.
+    """
+    generation_key = 'throttle:generation'
+
+    def __init__(self, alias):
+        self.alias = alias
+
+    def hit(self, key, window_start, window):
+        cache = caches[self.alias]
+        generation = cache.get_or_set(self.generation_key, time.time_ns, timeout=None)
+        key = f'{generation}:{key}'
+        current_key = f'throttle:{key}:{window_start}'
+        cache.add(current_key, 0, timeout=2 * window)
+        try:
+            current = cache.incr(current_key)
+        except ValueError:
+            # Evicted between add() and incr().
+            cache.set(current_key, 1, timeout=2 * window)
+            current = 1
+        previous = cache.get(f'throttle:{key}:{window_start - window}', 0)
+        return current, previous
+
+    def clear(self):
+        caches[self.alias].set(self.generation_key, time.time_ns(), timeout=None)
+
+
+local_memory_store = LocalMemoryStore()
+
+
+def get_store():
+    if getattr(settings, 'THROTTLE_STORE', 'cache') == 'memory':
+        return local_memory_store
+    return CacheStore(getattr(settings, 'THROTTLE_CACHE_ALIAS', 'default'))
+
+
+class SlidingWindowThrottle(BaseThrottle):
+    timer = time.time
+
+    def get_scope(self, view):
+        return getattr(view, 'throttle_scopes', {}).get(getattr(view, 'action', None))
+
+    def get_rate_scope(self, scope):
+        return scope
+
+    def get_key(self, request, scope):
+        raise NotImplementedError
+
+    def allow_request(self, request, view):
+        scope = self.get_scope(view)
+        if scope is None:
+            return True
+        rate = api_settings.DEFAULT_THROTTLE_RATES.get(self.get_rate_scope(scope))
+        if rate is None:
+            return True
+        limit, window = parse_rate(rate)
+
+        now = self.timer()
+        window_start = int(now // window) * window
+        current, previous = get_store().hit(self.get_key(request, scope), window_start, window)
+        elapsed = now - window_start
+        if previous * (1 - elapsed / window) + current <= limit:
+            return True
+
+        request.throttle_rejected = True
+
+        if current > limit or not previous:
+            # The current window alone is over the limit: wait for the next one.
+            self.wait_seconds = window - elapsed
+        else:
+            # Wait until enough of the previous window has slid out of view.
+            self.wait_seconds = max(window * (1 - (limit - current) / previous) - elapsed, 1)
+        return False
+
+    def wait(self):
+        return getattr(self, 'wait_seconds', None)
+
+
+class IPRateThrottle(SlidingWindowThrottle):
+    """Limits each client IP to the scope's rate."""
+
+    def get_key(self, request, scope):
+        return f'{scope}:ip:{self.get_ident(request)}'
+
+
+class EndpointRateThrottle(SlidingWindowThrottle):
+    """Caps an endpoint across all clients with the "<scope>:all" rate, if one is set."""
+
+    def get_rate_scope(self, scope):
+        return f'{scope}:all'
+
+    def allow_request(self, request, view):
+        # DRF checks every throttle, so skip requests an earlier one already rejected.
+        if getattr(request, 'throttle_rejected', False):
+            return True
+        return super().allow_request(request, view)
+
+    def get_key(self, request, scope):
+        return f'{scope}:all'
@@ -0,0 +1,119 @@
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.core.files import File
+
+CHUNK_SIZE = 64 * 1024
+
+
+class UploadError(Exception):
+    pass
+
+
+class AssembledFile(File):
+    """
+    An upload that already sits complete on local disk. FileSystemStorage moves files
+    that expose `temporary_file_path()` into place instead of copying them.
+    """
+
+    def temporary_file_path(self):
+        return self.file.name
+
+
+def upload_dir():
+    path = Path(getattr(settings, 'CHUNKED_UPLOAD_DIR', None) or Path(settings.MEDIA_ROOT) / 'chunked-uploads')
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def part_path(session):
+    return upload_dir() / f'{session.upload_id}.part'
+
+
+def max_upload_size():
+    return getattr(settings, 'CHUNKED_UPLOAD_MAX_SIZE', 2 * 1024 ** 3)
+
+
+def max_chunk_size():
+    return getattr(settings, 'CHUNKED_UPLOAD_MAX_CHUNK_SIZE', 16 * 1024 ** 2)
+
+
+def check_chunk(session, offset, length):
+    if offset != session.received_bytes:
+        raise UploadError(f'Expected offset {session.received_bytes}, got {offset}.')
+    if length > max_chunk_size():
+        raise UploadError(f'Chunks may be at most {max_chunk_size()} bytes.')
+    if offset + length > session.total_size:
+        raise UploadError('Chunk extends past the declared upload size.')
+
+
+def receive_chunk(session, offset, stream, length):
+    """
+    Copy up to `length` bytes from `stream` into a new temporary file, 64 KiB at a time,
+    and return its path. This is the slow part of a chunk and touches no database rows.
+    If the client disconnects half way, the bytes that did arrive are kept so the client
+    can resume after them.
+    """
+    check_chunk(session, offset, length)
+    fd, path = tempfile.mkstemp(dir=upload_dir(), prefix=f'{session.upload_id}.', suffix='.chunk')
+    with os.fdopen(fd, 'wb') as chunk:
+        remaining = length
+        while remaining > 0:
+            try:
+                data = stream.read(min(CHUNK_SIZE, remaining))
+            except OSError:
+                break
+            if not data:
+                break
+            chunk.write(data)
+            remaining -= len(data)
+    return path
+
+
+def append_chunk(session, chunk_path):
+    """Write a received chunk to the part file at `received_bytes`; returns the bytes now on disk."""
+    path = part_path(session)
+    with open(path, 'r+b' if path.exists() else 'wb') as part, open(chunk_path, 'rb') as chunk:
+        part.seek(session.received_bytes)
+        part.truncate()
+        shutil.copyfileobj(chunk, part, 1024 * 1024)
+        part.flush()
+        os.fsync(part.fileno())
+        return part.tell()
+
+
+def discard_chunk(chunk_path):
+    try:
+        os.unlink(chunk_path)
+    except FileNotFoundError:
+        pass
+
+
+def file_checksum(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as part:
+        for block in iter(lambda: part.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def assembled_file(session, expected_checksum):
+    path = part_path(session)
+    if session.received_bytes != session.total_size or not path.exists():
+        raise UploadError(f'Upload incomplete: {session.received_bytes} of {session.total_size} bytes received.')
+    if not expected_checksum:
+        raise UploadError('A sha256 checksum of the whole file is required.')
+    if file_checksum(path).lower() != str(expected_checksum).strip().lower():
+        raise UploadError('Checksum mismatch.')
+    return AssembledFile(open(path, 'rb'), name=session.filename)
+
+
+def discard(session):
+    try:
+        part_path(session).unlink()
+    except FileNotFoundError:
+        pass
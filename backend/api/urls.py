@@ -1,6 +1,7 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from . import views
+from .async_views import async_urlpatterns
 
 router = DefaultRouter()
 router.register(r'users', views.UserViewSet)
@@ -17,7 +18,12 @@ router.register(r'schemes-projects', views.SchemesAndProjectsViewSet)
 router.register(r'feedback', views.FeedbackViewSet)
 router.register(r'helpline-queries', views.HelpLineQueriesViewSet)
 router.register(r'auth', views.AuthViewSet, basename='auth')
+router.register(r'search', views.SearchViewSet, basename='search')
+router.register(r'home', views.HomeViewSet, basename='home')
+router.register(r'cache-stats', views.CacheStatsViewSet, basename='cache-stats')
+router.register(r'dashboard', views.DashboardViewSet, basename='dashboard')
+router.register(r'uploads', views.UploadViewSet, basename='uploads')
 
-urlpatterns = [
+urlpatterns = async_urlpatterns() + [
     path('', include(router.urls)),
 ]
\ No newline at end of file
@@ -1,14 +1,39 @@
-from rest_framework import viewsets, permissions, status
+import hashlib
+
+from rest_framework import viewsets, mixins, permissions, status, filters
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.generics import get_object_or_404
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from rest_framework.authtoken.models import Token
 from django.contrib.auth import login, logout
+from django.contrib.auth.hashers import make_password
 from django.middleware.csrf import get_token
+from django.db import transaction
+from django.db.models import CharField, Count, Max, Value
+from django.db.models.fields.files import FieldFile
+from django.http import Http404
+from django.utils.http import parse_etags, quote_etag
 from .models import *
 from .serializers import *
+from .filters import ActiveFilter, DateRangeFilter, FieldFilter
+from .cache import CachedResponseMixin, get_cache, get_stats, get_timeout, get_versions, reset_stats, time_slot
+from .conditional import ConditionalGetMixin
+from .fieldsets import SparseFieldsetMixin, narrow_queryset
+from .bulk import BulkActionsMixin
+from .exports import ExportMixin
+from . import search
+from .downloads import FileDownloadMixin, file_response
+from . import images, uploads
+from .authentication import AuthenticationStrategyMixin, issue_token, revoke_cached_tokens, rotate_token, token_expires_at
+from .permissions import HasRolePermission, has_role_permission, permission_name
+from .notifications import send_feedback_acknowledgement, send_welcome_email
 
-class AuthViewSet(viewsets.ViewSet):
+class AuthViewSet(AuthenticationStrategyMixin, viewsets.ViewSet):
     permission_classes = [permissions.AllowAny]
+    anonymous_actions = ['login', 'register']
+    throttle_scopes = {'login': 'login', 'register': 'register'}
 
     @action(detail=False, methods=['post'])
     def login(self, request):
@@ -19,8 +44,8 @@ class AuthViewSet(viewsets.ViewSet):
             # Login the user (creates session)
             login(request, user)
             
-            # Generate or get token (if using token authentication)
-            token, created = Token.objects.get_or_create(user=user)
+            # Reuse the current token, or rotate it once it is past half its lifetime
+            token = issue_token(user)
             
             # Get user data
             user_data = UserProfileSerializer(user).data
@@ -30,6 +55,7 @@ class AuthViewSet(viewsets.ViewSet):
             
             return Response({
                 'token': token.key,
+                'expires_at': token_expires_at(token),
                 'user': user_data,
                 'csrf_token': csrf_token,
                 'message': 'Login successful'
@@ -45,11 +71,13 @@ class AuthViewSet(viewsets.ViewSet):
             
             # Generate token for new user
             token = Token.objects.create(user=user)
+            send_welcome_email.enqueue(user.pk)
             
             user_data = UserProfileSerializer(user).data
             
             return Response({
                 'token': token.key,
+                'expires_at': token_expires_at(token),
                 'user': user_data,
                 'message': 'Registration successful'
             }, status=status.HTTP_201_CREATED)
@@ -73,6 +101,20 @@ class AuthViewSet(viewsets.ViewSet):
             'message': 'User was not logged in'
         }, status=status.HTTP_400_BAD_REQUEST)
 
+    @action(detail=False, methods=['post'])
+    def refresh(self, request):
+        if request.user.is_authenticated:
+            token = rotate_token(request.user)
+            return Response({
+                'token': token.key,
+                'expires_at': token_expires_at(token),
+                'message': 'Token refreshed'
+            }, status=status.HTTP_200_OK)
+        
+        return Response({
+            'error': 'User not authenticated'
+        }, status=status.HTTP_401_UNAUTHORIZED)
+
     @action(detail=False, methods=['get'])
     def profile(self, request):
         if request.user.is_authenticated:
@@ -96,115 +138,466 @@ class AuthViewSet(viewsets.ViewSet):
         }, status=status.HTTP_200_OK)
     
 
-class UserViewSet(viewsets.ModelViewSet):
+class CacheStatsViewSet(viewsets.ViewSet):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def list(self, request):
+        return Response(get_stats(), status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['post'])
+    def reset(self, request):
+        reset_stats()
+        return Response({
+            'message': 'Cache statistics reset'
+        }, status=status.HTTP_200_OK)
+
+
+class DashboardViewSet(viewsets.ViewSet):
+    """
+    Row counts for the admin dashboard, so it doesn't page through every list to
+    count them.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    count_models = {
+        'users': User,
+        'notices': Notice,
+        'tenders': Tender,
+        'news_events': NewsAndEvents,
+        'schemes_projects': SchemesAndProjects,
+        'feedback': Feedback,
+        'helpline_queries': HelpLineQueries,
+    }
+
+    def list(self, request):
+        return Response({
+            name: model.objects.count() for name, model in self.count_models.items()
+        }, status=status.HTTP_200_OK)
+
+
+class SearchViewSet(AuthenticationStrategyMixin, viewsets.ViewSet):
+    permission_classes = [permissions.AllowAny]
+    anonymous_actions = ['list']
+    max_page_size = 100
+
+    def list(self, request):
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response({
+                'error': 'Query parameter "q" is required'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        types = [item for item in request.query_params.get('type', '').split(',') if item]
+        unknown = [item for item in types if item not in search.SOURCES_BY_TYPE]
+        if unknown:
+            return Response({
+                'error': f"Unknown type: {', '.join(unknown)}"
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            page = max(int(request.query_params.get('page', 1)), 1)
+            page_size = min(max(int(request.query_params.get('page_size', 20)), 1), self.max_page_size)
+        except ValueError:
+            return Response({
+                'error': 'page and page_size must be integers'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        total, hits = search.search(query, types, limit=page_size, offset=(page - 1) * page_size)
+        return Response({
+            'count': total,
+            'page': page,
+            'page_size': page_size,
+            'results': hits,
+        }, status=status.HTTP_200_OK)
+
+
+class HomeViewSet(AuthenticationStrategyMixin, viewsets.ViewSet):
+    """
+    The latest rows of each homepage section in one response: one query per section,
+    cached as a whole. Like the list endpoints, the key holds the generations of every
+    model it renders, the newest `updated_at` and row count of each section (read in
+    one UNION query per request) and, since active notices and open tenders depend on
+    the clock, the current `time_bucket`.
+    """
+    permission_classes = [permissions.AllowAny]
+    anonymous_actions = ['list']
+    section_size = 6
+    max_section_size = 20
+    cache_models = (Notice, NewsAndEvents, Tender, Gallery, SchemesAndProjects)
+    time_bucket = CachedResponseMixin.time_bucket
+
+    def get_sections(self):
+        return {
+            'notices': (Notice.objects.active().order_by(*NoticeViewSet.cursor_ordering), NoticeSummarySerializer),
+            'news_events': (NewsAndEvents.objects.order_by('-news_event_id'), NewsAndEventsSummarySerializer),
+            'tenders': (Tender.objects.active().order_by(*TenderViewSet.cursor_ordering), TenderSummarySerializer),
+            'gallery': (Gallery.objects.order_by(*GalleryViewSet.cursor_ordering), GallerySummarySerializer),
+            'schemes_projects': (SchemesAndProjects.objects.order_by('-sp_id'), SchemesAndProjectsSummarySerializer),
+        }
+
+    def get_fingerprint(self, sections):
+        combined = None
+        for name, (queryset, _) in sections.items():
+            stats = (
+                queryset.order_by()
+                .annotate(section=Value(name, output_field=CharField()))
+                .values('section')
+                .annotate(last_modified=Max('updated_at'), count=Count('pk'))
+                .values_list('section', 'last_modified', 'count')
+            )
+            combined = stats if combined is None else combined.union(stats, all=True)
+        return ';'.join(f'{section}|{last_modified}|{count}' for section, last_modified, count in sorted(combined))
+
+    def list(self, request):
+        try:
+            size = min(max(int(request.query_params.get('limit', self.section_size)), 1), self.max_section_size)
+        except ValueError:
+            return Response({
+                'error': 'limit must be an integer'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        sections = self.get_sections()
+        versions = '.'.join(str(version) for version in get_versions(self.cache_models))
+        fingerprint = hashlib.md5(self.get_fingerprint(sections).encode()).hexdigest()
+        key = f'home:{versions}:{size}:{fingerprint}{time_slot(self.time_bucket)}'
+        cache = get_cache()
+        cached = cache.get(key)
+        if cached is None:
+            data = {}
+            for name, (queryset, serializer_class) in sections.items():
+                serializer = serializer_class()
+                rows = narrow_queryset(queryset, serializer, list(serializer.fields))[:size]
+                data[name] = serializer_class(rows, many=True).data
+            etag = quote_etag(hashlib.md5(JSONRenderer().render(data)).hexdigest())
+            cache.set(key, (data, etag), get_timeout())
+            cache_status = 'MISS'
+        else:
+            data, etag = cached
+            cache_status = 'HIT'
+
+        if_none_match = request.headers.get('If-None-Match')
+        if if_none_match and etag in [tag.removeprefix('W/') for tag in parse_etags(if_none_match)]:
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(data, status=status.HTTP_200_OK)
+        response['ETag'] = etag
+        response['X-Cache'] = cache_status
+        return response
+
+
+class UploadViewSet(mixins.CreateModelMixin, mixins.RetrieveModelMixin, mixins.DestroyModelMixin, viewsets.GenericViewSet):
+    """
+    Resumable uploads: POST to open a session, PUT raw bytes to `chunk/` at the current
+    offset (repeat, resuming from `received_bytes` after a dropped connection), then POST
+    `complete/` with the sha256 and the Gallery or Tender fields to create the row.
+    """
+    serializer_class = UploadSessionSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = None
+    target_serializers = {
+        'gallery': (GallerySerializer, 'file_path'),
+        'tender': (TenderSerializer, 'tender_document_path'),
+    }
+
+    def get_queryset(self):
+        return UploadSession.objects.filter(created_by=self.request.user)
+
+    def check_target_permission(self, target):
+        # Finishing an upload creates a Gallery or Tender row, so it needs the same grant.
+        model = self.target_serializers[target][0].Meta.model
+        if not has_role_permission(self.request.user, permission_name(model, 'add')):
+            self.permission_denied(self.request, message=HasRolePermission.message)
+
+    def perform_create(self, serializer):
+        self.check_target_permission(serializer.validated_data['target'])
+        serializer.save(created_by=self.request.user)
+
+    def perform_destroy(self, instance):
+        uploads.discard(instance)
+        instance.delete()
+
+    @action(detail=True, methods=['put'])
+    def chunk(self, request, pk=None):
+        try:
+            offset = int(request.headers.get('Upload-Offset', request.query_params.get('offset', '')))
+            length = int(request.META.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            return Response({
+                'error': 'Upload-Offset header and Content-Length are required'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        session = self.get_object()
+        if session.status != 'Pending':
+            return Response({
+                'error': 'Upload already completed'
+            }, status=status.HTTP_409_CONFLICT)
+        if offset != session.received_bytes:
+            return self.offset_response(session, status.HTTP_409_CONFLICT, error='Offset does not match received bytes')
+        try:
+            chunk_path = uploads.receive_chunk(session, offset, request.stream, length)
+        except uploads.UploadError as exc:
+            return self.offset_response(session, status.HTTP_400_BAD_REQUEST, error=str(exc))
+
+        # The network read above holds no lock: with SQLite's IMMEDIATE transactions a lock
+        # taken there would block every other write for as long as the client takes to send.
+        # The row lock only covers re-checking the offset and appending from local disk, so
+        # two retries of the same chunk cannot both be applied.
+        try:
+            with transaction.atomic():
+                session = get_object_or_404(self.get_queryset().select_for_update(), pk=pk)
+                if session.status != 'Pending':
+                    return Response({
+                        'error': 'Upload already completed'
+                    }, status=status.HTTP_409_CONFLICT)
+                if offset != session.received_bytes:
+                    return self.offset_response(session, status.HTTP_409_CONFLICT, error='Offset does not match received bytes')
+                session.received_bytes = uploads.append_chunk(session, chunk_path)
+                session.save(update_fields=['received_bytes', 'updated_at'])
+        finally:
+            uploads.discard_chunk(chunk_path)
+        return self.offset_response(session, status.HTTP_200_OK)
+
+    @action(detail=True, methods=['post'])
+    def complete(self, request, pk=None):
+        session = self.get_object()
+        self.check_target_permission(session.target)
+        if session.status != 'Pending':
+            return Response({
+                'error': 'Upload already completed'
+            }, status=status.HTTP_409_CONFLICT)
+        try:
+            assembled = uploads.assembled_file(session, request.data.get('checksum'))
+        except uploads.UploadError as exc:
+            return self.offset_response(session, status.HTTP_400_BAD_REQUEST, error=str(exc))
+
+        serializer_class, file_field = self.target_serializers[session.target]
+        data = {key: value for key, value in request.data.items() if key != 'checksum'}
+        data[file_field] = assembled
+        serializer = serializer_class(data=data, context=self.get_serializer_context())
+        try:
+            if not serializer.is_valid():
+                return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+            with transaction.atomic():
+                # Checked again under the row lock, so two concurrent completions cannot
+                # both create a row, and a chunk appended since the checksum was verified
+                # is not completed with the old bytes.
+                locked = get_object_or_404(self.get_queryset().select_for_update(), pk=pk)
+                if locked.status != 'Pending':
+                    return Response({
+                        'error': 'Upload already completed'
+                    }, status=status.HTTP_409_CONFLICT)
+                if locked.received_bytes != session.received_bytes:
+                    return self.offset_response(locked, status.HTTP_409_CONFLICT, error='Upload changed while completing')
+                session = locked
+                instance = serializer.save()
+                session.status = 'Complete'
+                session.save(update_fields=['status', 'updated_at'])
+        finally:
+            assembled.close()
+        uploads.discard(session)
+        return Response({
+            'upload': UploadSessionSerializer(session).data,
+            session.target: serializer_class(instance, context=self.get_serializer_context()).data,
+        }, status=status.HTTP_201_CREATED)
+
+    def offset_response(self, session, status_code, **extra):
+        response = Response({**extra, 'received_bytes': session.received_bytes}, status=status_code)
+        response['Upload-Offset'] = str(session.received_bytes)
+        return response
+
+
+class UserViewSet(BulkActionsMixin, viewsets.ModelViewSet):
     queryset = User.objects.all()
     serializer_class = UserSerializer
-    permission_classes = [permissions.IsAuthenticated]
+    permission_classes = [permissions.IsAuthenticated, HasRolePermission]
+
+    def get_bulk_attrs(self, validated_data, instance=None):
+        # The same rules as UserSerializer.create/update: a password is required to
+        # create a user, and to change one unless the requester is a superuser.
+        attrs = super().get_bulk_attrs(validated_data, instance)
+        if attrs.get('password'):
+            attrs['password'] = make_password(attrs['password'])
+        elif instance is None:
+            raise ValidationError({'password': ['This field is required when creating a user.']})
+        elif not self.request.user.is_superuser:
+            raise ValidationError({'password': ['This field is required.']})
+        else:
+            attrs.pop('password', None)
+        return attrs
+
+    def bulk_written(self, instances):
+        super().bulk_written(instances)
+        for user in instances:
+            revoke_cached_tokens(user.pk)
 
 class RoleViewSet(viewsets.ModelViewSet):
     queryset = Role.objects.all()
     serializer_class = RoleSerializer
-    permission_classes = [permissions.IsAuthenticated]
+    permission_classes = [permissions.IsAuthenticated, HasRolePermission]
 
 class UserRolesViewSet(viewsets.ModelViewSet):
-    queryset = UserRoles.objects.all()
+    queryset = UserRoles.objects.select_related('user', 'role')
     serializer_class = UserRolesSerializer
-    permission_classes = [permissions.IsAuthenticated]
+    permission_classes = [permissions.IsAuthenticated, HasRolePermission]
 
 class PermissionViewSet(viewsets.ModelViewSet):
     queryset = Permission.objects.all()
     serializer_class = PermissionSerializer
-    permission_classes = [permissions.IsAuthenticated]
+    permission_classes = [permissions.IsAuthenticated, HasRolePermission]
 
 class RolePermissionsViewSet(viewsets.ModelViewSet):
-    queryset = RolePermissions.objects.all()
+    queryset = RolePermissions.objects.select_related('role', 'permission')
     serializer_class = RolePermissionsSerializer
-    permission_classes = [permissions.IsAuthenticated]
+    permission_classes = [permissions.IsAuthenticated, HasRolePermission]
 
-class NoticeViewSet(viewsets.ModelViewSet):
-    queryset = Notice.objects.all()
+class NoticeViewSet(AuthenticationStrategyMixin, FileDownloadMixin, ConditionalGetMixin, CachedResponseMixin, SparseFieldsetMixin, BulkActionsMixin, viewsets.ModelViewSet):
+    queryset = Notice.objects.select_related('created_by')
     serializer_class = NoticeSerializer
+    summary_serializer_class = NoticeSummarySerializer
+    bulk_owner_field = 'created_by'
+    anonymous_actions = ['list', 'retrieve', 'download']
+    download_field = 'document_file_path'
+    cache_models = (Notice, User)
+    cursor_ordering = ('-publish_date', '-notice_id')
+    filter_backends = [FieldFilter, DateRangeFilter, ActiveFilter, filters.OrderingFilter]
+    filter_fields = ['status']
+    date_range_fields = ['publish_date', 'expiry_date']
+    ordering_fields = ['publish_date', 'title']
     
     def get_permissions(self):
-        if self.action in ['list', 'retrieve']:
+        if self.action in self.anonymous_actions:
             permission_classes = [permissions.AllowAny]
         else:
-            permission_classes = [permissions.IsAuthenticated]
+            permission_classes = [permissions.IsAuthenticated, HasRolePermission]
         return [permission() for permission in permission_classes]
 
-class TenderViewSet(viewsets.ModelViewSet):
+class TenderViewSet(AuthenticationStrategyMixin, FileDownloadMixin, ConditionalGetMixin, CachedResponseMixin, SparseFieldsetMixin, BulkActionsMixin, viewsets.ModelViewSet):
     queryset = Tender.objects.all()
     serializer_class = TenderSerializer
+    summary_serializer_class = TenderSummarySerializer
+    anonymous_actions = ['list', 'retrieve', 'download']
+    download_field = 'tender_document_path'
+    cursor_ordering = ('-submission_deadline', '-tender_id')
+    filter_backends = [DateRangeFilter, ActiveFilter, filters.OrderingFilter]
+    date_range_fields = ['submission_deadline', 'opening_date']
+    ordering_fields = ['submission_deadline', 'title']
     
     def get_permissions(self):
-        if self.action in ['list', 'retrieve']:
+        if self.action in self.anonymous_actions:
             permission_classes = [permissions.AllowAny]
         else:
-            permission_classes = [permissions.IsAuthenticated]
+            permission_classes = [permissions.IsAuthenticated, HasRolePermission]
         return [permission() for permission in permission_classes]
 
-class NewsAndEventsViewSet(viewsets.ModelViewSet):
-    queryset = NewsAndEvents.objects.all()
+class NewsAndEventsViewSet(AuthenticationStrategyMixin, ConditionalGetMixin, CachedResponseMixin, SparseFieldsetMixin, BulkActionsMixin, viewsets.ModelViewSet):
+    queryset = NewsAndEvents.objects.select_related('created_by')
     serializer_class = NewsAndEventsSerializer
+    summary_serializer_class = NewsAndEventsSummarySerializer
+    bulk_owner_field = 'created_by'
+    anonymous_actions = ['list', 'retrieve']
+    cache_models = (NewsAndEvents, User)
     
     def get_permissions(self):
-        if self.action in ['list', 'retrieve']:
+        if self.action in self.anonymous_actions:
             permission_classes = [permissions.AllowAny]
         else:
-            permission_classes = [permissions.IsAuthenticated]
+            permission_classes = [permissions.IsAuthenticated, HasRolePermission]
         return [permission() for permission in permission_classes]
 
-class GalleryViewSet(viewsets.ModelViewSet):
+class GalleryViewSet(AuthenticationStrategyMixin, FileDownloadMixin, ConditionalGetMixin, CachedResponseMixin, SparseFieldsetMixin, BulkActionsMixin, viewsets.ModelViewSet):
     queryset = Gallery.objects.all()
     serializer_class = GallerySerializer
+    summary_serializer_class = GallerySummarySerializer
+    anonymous_actions = ['list', 'retrieve', 'download', 'variant']
+    download_field = 'file_path'
+    cursor_ordering = ('-upload_date', '-media_id')
+    
+    @action(detail=True, methods=['get'], url_path=r'variants/(?P<width>\d+)', url_name='variant')
+    def variant(self, request, pk=None, width=None):
+        instance = self.get_object()
+        variant = next((item for item in instance.variants or [] if str(item['width']) == width), None)
+        if variant is None:
+            raise Http404('No such variant.')
+        return file_response(request, FieldFile(instance, instance.file_path.field, variant['name']))
+
+    def bulk_deleted(self, instances):
+        super().bulk_deleted(instances)
+        for instance in instances:
+            images.delete_variants(instance.file_path.storage, instance.variants)
     
     def get_permissions(self):
-        if self.action in ['list', 'retrieve']:
+        if self.action in self.anonymous_actions:
             permission_classes = [permissions.AllowAny]
         else:
-            permission_classes = [permissions.IsAuthenticated]
+            permission_classes = [permissions.IsAuthenticated, HasRolePermission]
         return [permission() for permission in permission_classes]
 
-class DocumentsViewSet(viewsets.ModelViewSet):
-    queryset = Documents.objects.all()
+class DocumentsViewSet(AuthenticationStrategyMixin, FileDownloadMixin, ConditionalGetMixin, CachedResponseMixin, SparseFieldsetMixin, BulkActionsMixin, viewsets.ModelViewSet):
+    queryset = Documents.objects.select_related('uploaded_by')
     serializer_class = DocumentsSerializer
+    summary_serializer_class = DocumentsSummarySerializer
+    bulk_owner_field = 'uploaded_by'
+    anonymous_actions = ['list', 'retrieve', 'download']
+    download_field = 'file_path'
+    cache_models = (Documents, User)
     
     def get_permissions(self):
-        if self.action in ['list', 'retrieve']:
+        if self.action in self.anonymous_actions:
             permission_classes = [permissions.AllowAny]
         else:
-            permission_classes = [permissions.IsAuthenticated]
+            permission_classes = [permissions.IsAuthenticated, HasRolePermission]
         return [permission() for permission in permission_classes]
 
-class SchemesAndProjectsViewSet(viewsets.ModelViewSet):
+class SchemesAndProjectsViewSet(AuthenticationStrategyMixin, ConditionalGetMixin, CachedResponseMixin, SparseFieldsetMixin, BulkActionsMixin, viewsets.ModelViewSet):
     queryset = SchemesAndProjects.objects.all()
     serializer_class = SchemesAndProjectsSerializer
+    summary_serializer_class = SchemesAndProjectsSummarySerializer
+    anonymous_actions = ['list', 'retrieve']
     
     def get_permissions(self):
-        if self.action in ['list', 'retrieve']:
+        if self.action in self.anonymous_actions:
             permission_classes = [permissions.AllowAny]
         else:
-            permission_classes = [permissions.IsAuthenticated]
+            permission_classes = [permissions.IsAuthenticated, HasRolePermission]
         return [permission() for permission in permission_classes]
 
-class FeedbackViewSet(viewsets.ModelViewSet):
-    queryset = Feedback.objects.all()
+class FeedbackViewSet(AuthenticationStrategyMixin, ExportMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
+    queryset = Feedback.objects.select_related('citizen_user')
     serializer_class = FeedbackSerializer
+    summary_serializer_class = FeedbackSummarySerializer
+    anonymous_actions = ['create']
+    throttle_scopes = {'create': 'feedback'}
+    cursor_ordering = ('-submitted_date', '-feedback_id')
+    filter_backends = [FieldFilter, DateRangeFilter]
+    filter_fields = ['status']
+    date_range_fields = ['submitted_date']
+    export_fields = ['feedback_id', 'subject', 'message', 'citizen_name', 'citizen_email', 'citizen_user__username', 'status', 'submitted_date']
+    
+    def perform_create(self, serializer):
+        feedback = serializer.save()
+        send_feedback_acknowledgement.enqueue(feedback.pk)
     
     def get_permissions(self):
-        if self.action in ['create']:
+        if self.action in self.anonymous_actions:
             permission_classes = [permissions.AllowAny]
         else:
-            permission_classes = [permissions.IsAuthenticated]
+            permission_classes = [permissions.IsAuthenticated, HasRolePermission]
         return [permission() for permission in permission_classes]
 
-class HelpLineQueriesViewSet(viewsets.ModelViewSet):
-    queryset = HelpLineQueries.objects.all()
+class HelpLineQueriesViewSet(AuthenticationStrategyMixin, ExportMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
+    queryset = HelpLineQueries.objects.select_related('assigned_to')
     serializer_class = HelpLineQueriesSerializer
+    summary_serializer_class = HelpLineQueriesSummarySerializer
+    anonymous_actions = ['create']
+    throttle_scopes = {'create': 'helpline'}
+    cursor_ordering = ('-query_date', '-query_id')
+    filter_backends = [FieldFilter, DateRangeFilter]
+    filter_fields = ['assigned_to']
+    date_range_fields = ['query_date']
+    export_fields = ['query_id', 'title', 'details', 'contact_number', 'query_date', 'assigned_to__username']
     
     def get_permissions(self):
-        if self.action in ['create']:
+        if self.action in self.anonymous_actions:
             permission_classes = [permissions.AllowAny]
         else:
-            permission_classes = [permissions.IsAuthenticated]
+            permission_classes = [permissions.IsAuthenticated, HasRolePermission]
         return [permission() for permission in permission_classes]
\ No newline at end of file
@@ -10,9 +10,12 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 from corsheaders.defaults import default_headers
 
+from .database import database_from_env, env_bool
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -48,14 +51,51 @@ INSTALLED_APPS = [
 REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
+        'api.permissions.HasRolePermission',
     ],
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication', 
+        'api.authentication.CachedTokenAuthentication',
         'rest_framework.authentication.SessionAuthentication',
-        'rest_framework.authentication.BasicAuthentication',
     ],
+    'DEFAULT_PAGINATION_CLASS': 'api.pagination.PortalCursorPagination',
+    'PAGE_SIZE': 20,
+    # Proxies in front of the app that append to X-Forwarded-For. Throttles identify clients
+    # by the address the last of them saw; with 0 they use REMOTE_ADDR and ignore the
+    # header, which clients can set to anything.
+    'NUM_PROXIES': int(os.environ.get('NUM_PROXIES', 0)),
+    # Only actions listed in a view's `throttle_scopes` are throttled (api/throttling.py).
+    'DEFAULT_THROTTLE_CLASSES': [
+        'api.throttling.IPRateThrottle',
+        'api.throttling.EndpointRateThrottle',
+    ],
+    'DEFAULT_THROTTLE_RATES': {
+        'login': '10/min',
+        'register': '5/hour',
+        'feedback': '10/min',
+        'feedback:all': '120/min',
+        'helpline': '10/min',
+        'helpline:all': '120/min',
+    },
 }
 
+# 'cache' shares throttle counters through THROTTLE_CACHE_ALIAS (use a shared cache such as
+# Redis or Memcached when running several processes); 'memory' keeps them per process.
+THROTTLE_STORE = os.environ.get('THROTTLE_STORE', 'cache')
+THROTTLE_CACHE_ALIAS = 'default'
+
+# API tokens expire AUTH_TOKEN_TTL seconds after issue; login rotates them past half-life.
+# Successful lookups are cached per process (an LRU of AUTH_TOKEN_CACHE_SIZE entries,
+# each trusted for AUTH_TOKEN_CACHE_TTL seconds) and dropped on logout or user changes.
+# Other worker processes only hear of a logout through a shared RESPONSE_CACHE_ALIAS
+# cache; with LocMemCache they keep serving reads until the TTL runs out, but writes
+# always re-check the token row.
+AUTH_TOKEN_TTL = int(os.environ.get('AUTH_TOKEN_TTL', 12 * 60 * 60))
+AUTH_TOKEN_CACHE_SIZE = 1024
+AUTH_TOKEN_CACHE_TTL = 60
+# Adds a Server-Timing header with the time spent authenticating (see also
+# `manage.py benchmark_authentication`).
+AUTH_SERVER_TIMING = env_bool('AUTH_SERVER_TIMING', False)
+
 CORS_ALLOW_HEADERS = list(default_headers) + [
     'authorization',
 ]
@@ -68,6 +108,9 @@ CORS_ALLOWED_ORIGINS = [
 
 CORS_ALLOW_CREDENTIALS = True
 
+# Let the frontend read conditional-GET validators and cache status
+CORS_EXPOSE_HEADERS = ['ETag', 'Last-Modified', 'X-Cache']
+
 # CSRF settings
 CSRF_COOKIE_SAMESITE = 'Lax'
 SESSION_COOKIE_SAMESITE = 'Lax'
@@ -110,13 +153,28 @@ WSGI_APPLICATION = 'backend.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# Configured from DATABASE_URL (SQLite by default, Postgres supported), see backend/database.py
+
 DATABASES = {
+    'default': database_from_env(BASE_DIR),
+}
+
+
+# Caches
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Swap the backend (e.g. django.core.cache.backends.redis.RedisCache) to share the
+# response cache and its hit/miss counters across worker processes.
+
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'ukhimath-portal',
     }
 }
 
+RESPONSE_CACHE_ALIAS = 'default'
+RESPONSE_CACHE_TIMEOUT = 300
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -154,6 +212,43 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# Uploaded files (gallery media, documents, notice and tender attachments)
+# Files are served through the API's /download/ endpoints, never directly from MEDIA_URL.
+
+MEDIA_ROOT = Path(os.environ.get('MEDIA_ROOT', BASE_DIR / 'media'))
+MEDIA_URL = 'media/'
+
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+}
+
+# Hand file bodies to the web server instead of streaming them from a worker:
+# 'nginx' sets X-Accel-Redirect to FILE_DOWNLOAD_ACCEL_PREFIX + <file name> (an internal
+# location aliased to MEDIA_ROOT); 'sendfile' sets X-Sendfile (Apache mod_xsendfile, lighttpd).
+FILE_DOWNLOAD_OFFLOAD = os.environ.get('FILE_DOWNLOAD_OFFLOAD') or None
+FILE_DOWNLOAD_ACCEL_PREFIX = '/protected-media/'
+
+# Resumable uploads (api/uploads/) are assembled here before being moved into MEDIA_ROOT;
+# keep it on the same filesystem so the final move is a rename rather than a copy.
+CHUNKED_UPLOAD_DIR = Path(os.environ.get('CHUNKED_UPLOAD_DIR', MEDIA_ROOT / 'chunked-uploads'))
+CHUNKED_UPLOAD_MAX_SIZE = 2 * 1024 ** 3
+CHUNKED_UPLOAD_MAX_CHUNK_SIZE = 16 * 1024 ** 2
+
+# Background tasks (api/tasks.py). 'database' queues rows for `manage.py run_worker`;
+# 'memory' runs each task in-process after the request commits, with no worker needed.
+TASKS_BACKEND = os.environ.get('TASKS_BACKEND', 'database')
+TASKS_WORKER_CONCURRENCY = int(os.environ.get('TASKS_WORKER_CONCURRENCY', 4))
+# Seconds before a Running task whose worker vanished is handed back to the queue.
+TASKS_LOCK_TIMEOUT = 600
+
+EMAIL_BACKEND = os.environ.get('EMAIL_BACKEND', 'django.core.mail.backends.console.EmailBackend')
+DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', 'noreply@ukhimath.example')
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
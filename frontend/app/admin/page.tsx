@@ -11,15 +11,7 @@ import {
   FaProjectDiagram,
 } from 'react-icons/fa';
 import { IconType } from 'react-icons';
-import { 
-  usersAPI, 
-  noticesAPI, 
-  tendersAPI, 
-  newsEventsAPI, 
-  feedbackAPI, 
-  helplineQueriesAPI,
-  schemesProjectsAPI 
-} from '@/utils/api';
+import { dashboardAPI } from '@/utils/api';
 
 interface DashboardStats {
   users: number;
@@ -56,32 +48,15 @@ export default function AdminDashboard() {
 
   const fetchDashboardData = async (): Promise<void> => {
     try {
-      const [
-        usersRes,
-        noticesRes,
-        tendersRes,
-        newsEventsRes,
-        feedbackRes,
-        helplineQueriesRes,
-        schemesProjectsRes,
-      ] = await Promise.all([
-        usersAPI.getAll(),
-        noticesAPI.getAll(),
-        tendersAPI.getAll(),
-        newsEventsAPI.getAll(),
-        feedbackAPI.getAll(),
-        helplineQueriesAPI.getAll(),
-        schemesProjectsAPI.getAll(),
-      ]);
-
+      const { data } = await dashboardAPI.get();
       setStats({
-        users: usersRes.data.length,
-        notices: noticesRes.data.length,
-        tenders: tendersRes.data.length,
-        newsEvents: newsEventsRes.data.length,
-        feedback: feedbackRes.data.length,
-        helplineQueries: helplineQueriesRes.data.length,
-        schemesProjects: schemesProjectsRes.data.length,
+        users: data.users,
+        notices: data.notices,
+        tenders: data.tenders,
+        newsEvents: data.news_events,
+        feedback: data.feedback,
+        helplineQueries: data.helpline_queries,
+        schemesProjects: data.schemes_projects,
       });
     } catch (error) {
       console.error('Error fetching dashboard data:', error);
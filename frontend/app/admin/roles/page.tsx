@@ -28,14 +28,14 @@ export default function RolesPage() {
   const loadData = async () => {
     try {
       setLoading(true);
-      const [rolesResponse, permissionsResponse, rolePermissionsResponse] = await Promise.all([
+      const [allRoles, allPermissions, allRolePermissions] = await Promise.all([
         rolesAPI.getAll(),
         permissionsAPI.getAll(),
         rolePermissionsAPI.getAll()
       ]);
-      setRoles(rolesResponse.data);
-      setPermissions(permissionsResponse.data);
-      setRolePermissions(rolePermissionsResponse.data);
+      setRoles(allRoles);
+      setPermissions(allPermissions);
+      setRolePermissions(allRolePermissions);
     } catch (err) {
       setError('Failed to load data');
       console.error('Error loading data:', err);
@@ -1,9 +1,10 @@
 import { useState, useEffect } from 'react';
 import { SchemeProject } from '@/types';
-import { schemesProjectsAPI } from '@/utils/api';
+import { schemesProjectsAPI, cursorFromUrl } from '@/utils/api';
 
 export default function SchemesProjectsPage() {
   const [schemesProjects, setSchemesProjects] = useState<SchemeProject[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | undefined>();
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [showCreateModal, setShowCreateModal] = useState(false);
@@ -26,11 +27,13 @@ export default function SchemesProjectsPage() {
     loadSchemesProjects();
   }, []);
 
-  const loadSchemesProjects = async () => {
+  // Without a cursor this reloads the first page; with one it appends the next page.
+  const loadSchemesProjects = async (cursor?: string) => {
     try {
-      setLoading(true);
-      const response = await schemesProjectsAPI.getAll();
-      setSchemesProjects(response.data);
+      if (!cursor) setLoading(true);
+      const response = await schemesProjectsAPI.getPage({ expand: 'description', cursor });
+      setSchemesProjects((loaded) => (cursor ? [...loaded, ...response.data.results] : response.data.results));
+      setNextCursor(cursorFromUrl(response.data.next));
     } catch (err) {
       setError('Failed to load schemes & projects');
       console.error('Error loading schemes & projects:', err);
@@ -292,6 +295,17 @@ export default function SchemesProjectsPage() {
         })}
       </div>
 
+      {nextCursor && (
+        <div className="text-center">
+          <button
+            onClick={() => loadSchemesProjects(nextCursor)}
+            className="px-4 py-2 text-sm font-medium text-blue-600 bg-white border border-gray-300 rounded-md hover:bg-gray-50 disabled:opacity-50"
+          >
+            Load more schemes & projects
+          </button>
+        </div>
+      )}
+
       {/* Empty State */}
       {filteredItems.length === 0 && !loading && (
         <div className="bg-white rounded-lg shadow-sm border border-gray-200 p-12 text-center">
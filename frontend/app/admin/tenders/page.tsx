@@ -1,10 +1,11 @@
 "use client";
 import { useState, useEffect } from 'react';
 import { Tender } from '@/types';
-import { tendersAPI } from '@/utils/api';
+import { tendersAPI, cursorFromUrl } from '@/utils/api';
 
 export default function TendersPage() {
   const [tenders, setTenders] = useState<Tender[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | undefined>();
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [showCreateModal, setShowCreateModal] = useState(false);
@@ -26,11 +27,13 @@ export default function TendersPage() {
     loadTenders();
   }, []);
 
-  const loadTenders = async () => {
+  // Without a cursor this reloads the first page; with one it appends the next page.
+  const loadTenders = async (cursor?: string) => {
     try {
-      setLoading(true);
-      const response = await tendersAPI.getAll();
-      setTenders(response.data);
+      if (!cursor) setLoading(true);
+      const response = await tendersAPI.getPage({ expand: 'description', cursor });
+      setTenders((loaded) => (cursor ? [...loaded, ...response.data.results] : response.data.results));
+      setNextCursor(cursorFromUrl(response.data.next));
     } catch (err) {
       setError('Failed to load tenders');
       console.error('Error loading tenders:', err);
@@ -47,6 +50,7 @@ export default function TendersPage() {
       
       // Append text fields
       Object.keys(formData).forEach(key => {
+        if (key === 'tender_document_path') return;
         if (formData[key as keyof Tender] !== undefined && formData[key as keyof Tender] !== null) {
           submitData.append(key, formData[key as keyof Tender] as string);
         }
@@ -54,7 +58,7 @@ export default function TendersPage() {
 
       // Append file if selected
       if (file) {
-        submitData.append('tender_document', file);
+        submitData.append('tender_document_path', file);
       }
 
       await tendersAPI.create(submitData as any);
@@ -76,6 +80,7 @@ export default function TendersPage() {
       
       // Append text fields
       Object.keys(formData).forEach(key => {
+        if (key === 'tender_document_path') return;
         if (formData[key as keyof Tender] !== undefined && formData[key as keyof Tender] !== null) {
           submitData.append(key, formData[key as keyof Tender] as string);
         }
@@ -83,7 +88,7 @@ export default function TendersPage() {
 
       // Append file if selected
       if (file) {
-        submitData.append('tender_document', file);
+        submitData.append('tender_document_path', file);
       }
 
       await tendersAPI.update(selectedTender.tender_id, submitData as any);
@@ -266,6 +271,17 @@ export default function TendersPage() {
         ))}
       </div>
 
+      {nextCursor && (
+        <div className="text-center">
+          <button
+            onClick={() => loadTenders(nextCursor)}
+            className="px-4 py-2 text-sm font-medium text-blue-600 bg-white border border-gray-300 rounded-md hover:bg-gray-50 disabled:opacity-50"
+          >
+            Load more tenders
+          </button>
+        </div>
+      )}
+
       {/* Empty State */}
       {tenders.length === 0 && !loading && (
         <div className="bg-white rounded-lg shadow-sm border border-gray-200 p-12 text-center">
@@ -1,10 +1,11 @@
 "use client";
 import { useState, useEffect } from "react";
 import { User, Role, UserRole } from "@/types";
-import { usersAPI, rolesAPI, userRolesAPI } from "@/utils/api";
+import { usersAPI, rolesAPI, userRolesAPI, cursorFromUrl } from "@/utils/api";
 
 export default function UsersPage() {
   const [users, setUsers] = useState<User[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | undefined>();
   const [roles, setRoles] = useState<Role[]>([]);
   const [userRoles, setUserRoles] = useState<UserRole[]>([]);
   const [loading, setLoading] = useState(true);
@@ -38,15 +39,15 @@ export default function UsersPage() {
   const loadData = async () => {
     try {
       setLoading(true);
-      const [usersResponse, rolesResponse, userRolesResponse] =
-        await Promise.all([
-          usersAPI.getAll(),
-          rolesAPI.getAll(),
-          userRolesAPI.getAll(),
-        ]);
-      setUsers(usersResponse.data);
-      setRoles(rolesResponse.data);
-      setUserRoles(userRolesResponse.data);
+      const [usersResponse, allRoles, allUserRoles] = await Promise.all([
+        usersAPI.getPage(),
+        rolesAPI.getAll(),
+        userRolesAPI.getAll(),
+      ]);
+      setUsers(usersResponse.data.results);
+      setNextCursor(cursorFromUrl(usersResponse.data.next));
+      setRoles(allRoles);
+      setUserRoles(allUserRoles);
     } catch (err) {
       setError("Failed to load data");
       console.error("Error loading data:", err);
@@ -55,6 +56,17 @@ export default function UsersPage() {
     }
   };
 
+  const loadMoreUsers = async () => {
+    try {
+      const response = await usersAPI.getPage({ cursor: nextCursor });
+      setUsers((loaded) => [...loaded, ...response.data.results]);
+      setNextCursor(cursorFromUrl(response.data.next));
+    } catch (err) {
+      setError("Failed to load more users");
+      console.error("Error loading users:", err);
+    }
+  };
+
   const handleCreate = async (e: React.FormEvent) => {
     e.preventDefault();
 
@@ -355,6 +367,16 @@ export default function UsersPage() {
             </tbody>
           </table>
         </div>
+        {nextCursor && (
+          <div className="px-6 py-4 border-t border-gray-200 text-center">
+            <button
+              onClick={loadMoreUsers}
+              className="px-4 py-2 text-sm font-medium text-blue-600 bg-white border border-gray-300 rounded-md hover:bg-gray-50"
+            >
+              Load more users
+            </button>
+          </div>
+        )}
       </div>
 
       {/* Create User Modal */}
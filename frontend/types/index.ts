@@ -40,6 +40,7 @@ export interface Notice {
   document_file_path?: string;
   created_by: number;
   status: 'Draft' | 'Published' | 'Archived';
+  updated_at?: string;
 }
 
 export interface Tender {
@@ -49,6 +50,8 @@ export interface Tender {
   tender_document_path: string;
   submission_deadline: string;
   opening_date?: string;
+  is_closed?: boolean;
+  updated_at?: string;
 }
 
 export interface NewsEvent {
@@ -58,6 +61,7 @@ export interface NewsEvent {
   event_date?: string;
   type: 'News' | 'Event' | 'Announcement';
   created_by: number;
+  updated_at?: string;
 }
 
 export interface GalleryItem {
@@ -65,7 +69,20 @@ export interface GalleryItem {
   caption?: string;
   file_path: string;
   type: 'Photo' | 'Video';
+  width?: number | null;
+  height?: number | null;
+  variants?: GalleryVariant[];
+  blurhash?: string;
+  srcset?: string;
   upload_date: string;
+  updated_at?: string;
+}
+
+export interface GalleryVariant {
+  width: number;
+  height: number;
+  size: number;
+  name: string;
 }
 
 export interface Document {
@@ -74,6 +91,7 @@ export interface Document {
   category?: string;
   file_path: string;
   uploaded_by: number;
+  updated_at?: string;
 }
 
 export interface SchemeProject {
@@ -84,6 +102,7 @@ export interface SchemeProject {
   end_date?: string;
   budget?: string;
   type: 'Scheme' | 'Project';
+  updated_at?: string;
 }
 
 export interface Feedback {
@@ -113,6 +132,7 @@ export interface LoginCredentials {
 
 export interface AuthResponse {
   token: string;
+  expires_at?: string;
   user: User;
 }
 
@@ -120,4 +140,60 @@ export interface ApiResponse<T> {
   data: T;
   status: number;
   statusText: string;
-}
\ No newline at end of file
+}
+
+// List endpoints render summary rows; `expand` adds fields to them, `fields` picks exactly.
+export interface FieldParams {
+  fields?: string;
+  expand?: string;
+}
+
+export interface PageParams extends FieldParams {
+  page_size?: number;
+  cursor?: string;
+}
+
+export interface CursorPage<T> {
+  next: string | null;
+  previous: string | null;
+  results: T[];
+}
+
+export interface SearchHit {
+  type: 'notice' | 'tender' | 'news_event' | 'document' | 'scheme_project';
+  id: number;
+  title: string;
+  snippet: string;
+  rank: number | null;
+  url: string;
+}
+
+export interface SearchResults {
+  count: number;
+  page: number;
+  page_size: number;
+  results: SearchHit[];
+}
+
+// 400 body of the bulk endpoints: nothing was written, these items failed validation.
+export interface BulkErrors {
+  errors: { index: number; errors: Record<string, string[]> }[];
+}
+
+export interface HomeContent {
+  notices: Notice[];
+  news_events: NewsEvent[];
+  tenders: Tender[];
+  gallery: GalleryItem[];
+  schemes_projects: SchemeProject[];
+}
+
+export interface DashboardCounts {
+  users: number;
+  notices: number;
+  tenders: number;
+  news_events: number;
+  schemes_projects: number;
+  feedback: number;
+  helpline_queries: number;
+}
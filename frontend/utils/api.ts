@@ -14,7 +14,12 @@ import {
   Feedback,
   HelplineQuery,
   LoginCredentials,
-  AuthResponse
+  AuthResponse,
+  PageParams,
+  CursorPage,
+  SearchResults,
+  HomeContent,
+  DashboardCounts
 } from '@/types';
 
 const API_BASE_URL = 'http://127.0.0.1:8000/api/';
@@ -87,21 +92,42 @@ export const authAPI = {
   register: (userData: any): Promise<AxiosResponse<AuthResponse>> => 
     api.post('/auth/register/', userData),
   logout: (): Promise<AxiosResponse> => api.post('/auth/logout/'),
+  refresh: (): Promise<AxiosResponse<{ token: string; expires_at: string }>> => api.post('/auth/refresh/'),
   getProfile: (): Promise<AxiosResponse<User>> => api.get('/auth/profile/'),
   checkAuth: (): Promise<AxiosResponse<{ is_authenticated: boolean; user?: User }>> => 
     api.get('/auth/check_auth/'),
 };
 
+// Follows `next` links until the last page. Only for the small role and permission
+// tables the admin screens need whole; content lists use getPage.
+const fetchAllPages = async <T,>(url: string, params: PageParams = {}): Promise<T[]> => {
+  const rows: T[] = [];
+  let cursor: string | undefined;
+  do {
+    const response: AxiosResponse<CursorPage<T>> = await api.get(url, { params: { page_size: 100, ...params, cursor } });
+    rows.push(...response.data.results);
+    cursor = cursorFromUrl(response.data.next);
+  } while (cursor);
+  return rows;
+};
+
 export const usersAPI = {
-  getAll: (): Promise<AxiosResponse<User[]>> => api.get('/users/'),
+  getAll: (): Promise<User[]> => fetchAllPages<User>('/users/'),
+  getPage: (params: PageParams = {}): Promise<AxiosResponse<CursorPage<User>>> =>
+    api.get('/users/', { params: { page_size: 20, ...params } }),
   getById: (id: number): Promise<AxiosResponse<User>> => api.get(`/users/${id}/`),
   create: (data: Partial<User>): Promise<AxiosResponse<User>> => api.post('/users/', data),
   update: (id: number, data: Partial<User>): Promise<AxiosResponse<User>> => api.put(`/users/${id}/`, data),
   delete: (id: number): Promise<AxiosResponse> => api.delete(`/users/${id}/`),
+  bulkCreate: (items: Partial<User>[]): Promise<AxiosResponse<User[]>> => api.post('/users/bulk/', items),
+  bulkUpdate: (items: Partial<User>[]): Promise<AxiosResponse<User[]>> => api.patch('/users/bulk/', items),
+  bulkDelete: (ids: number[]): Promise<AxiosResponse<{ deleted: number }>> => api.delete('/users/bulk/', { data: { ids } }),
 };
 
 export const rolesAPI = {
-  getAll: (): Promise<AxiosResponse<Role[]>> => api.get('/roles/'),
+  getAll: (): Promise<Role[]> => fetchAllPages<Role>('/roles/'),
+  getPage: (params: PageParams = {}): Promise<AxiosResponse<CursorPage<Role>>> =>
+    api.get('/roles/', { params: { page_size: 20, ...params } }),
   getById: (id: number): Promise<AxiosResponse<Role>> => api.get(`/roles/${id}/`),
   create: (data: Partial<Role>): Promise<AxiosResponse<Role>> => api.post('/roles/', data),
   update: (id: number, data: Partial<Role>): Promise<AxiosResponse<Role>> => api.put(`/roles/${id}/`, data),
@@ -109,83 +135,142 @@ export const rolesAPI = {
 };
 
 export const userRolesAPI = {
-  getAll: (): Promise<AxiosResponse<UserRole[]>> => api.get('/user-roles/'),
+  getAll: (): Promise<UserRole[]> => fetchAllPages<UserRole>('/user-roles/'),
+  getPage: (params: PageParams = {}): Promise<AxiosResponse<CursorPage<UserRole>>> =>
+    api.get('/user-roles/', { params: { page_size: 20, ...params } }),
   create: (data: UserRole): Promise<AxiosResponse<UserRole>> => api.post('/user-roles/', data),
   delete: (userId: number, roleId: number): Promise<AxiosResponse> => 
     api.delete(`/user-roles/?user=${userId}&role=${roleId}`),
 };
 
 export const permissionsAPI = {
-  getAll: (): Promise<AxiosResponse<Permission[]>> => api.get('/permissions/'),
+  getAll: (): Promise<Permission[]> => fetchAllPages<Permission>('/permissions/'),
+  getPage: (params: PageParams = {}): Promise<AxiosResponse<CursorPage<Permission>>> =>
+    api.get('/permissions/', { params: { page_size: 20, ...params } }),
 };
 
 export const rolePermissionsAPI = {
-  getAll: (): Promise<AxiosResponse<RolePermission[]>> => api.get('/role-permissions/'),
+  getAll: (): Promise<RolePermission[]> => fetchAllPages<RolePermission>('/role-permissions/'),
+  getPage: (params: PageParams = {}): Promise<AxiosResponse<CursorPage<RolePermission>>> =>
+    api.get('/role-permissions/', { params: { page_size: 20, ...params } }),
   create: (data: RolePermission): Promise<AxiosResponse<RolePermission>> => api.post('/role-permissions/', data),
   delete: (roleId: number, permissionId: number): Promise<AxiosResponse> => 
     api.delete(`/role-permissions/?role=${roleId}&permission=${permissionId}`),
 };
 
 export const noticesAPI = {
-  getAll: (): Promise<AxiosResponse<Notice[]>> => api.get('/notices/'),
+  getPage: (params: PageParams = {}): Promise<AxiosResponse<CursorPage<Notice>>> =>
+    api.get('/notices/', { params: { page_size: 20, ...params } }),
+  getActive: (params: PageParams = {}): Promise<AxiosResponse<CursorPage<Notice>>> =>
+    api.get('/notices/', { params: { page_size: 20, ...params, active: true } }),
   getById: (id: number): Promise<AxiosResponse<Notice>> => api.get(`/notices/${id}/`),
   create: (data: Partial<Notice>): Promise<AxiosResponse<Notice>> => api.post('/notices/', data),
   update: (id: number, data: Partial<Notice>): Promise<AxiosResponse<Notice>> => api.put(`/notices/${id}/`, data),
   delete: (id: number): Promise<AxiosResponse> => api.delete(`/notices/${id}/`),
+  bulkCreate: (items: Partial<Notice>[]): Promise<AxiosResponse<Notice[]>> => api.post('/notices/bulk/', items),
+  bulkUpdate: (items: Partial<Notice>[]): Promise<AxiosResponse<Notice[]>> => api.patch('/notices/bulk/', items),
+  bulkDelete: (ids: number[]): Promise<AxiosResponse<{ deleted: number }>> => api.delete('/notices/bulk/', { data: { ids } }),
 };
 
 export const tendersAPI = {
-  getAll: (): Promise<AxiosResponse<Tender[]>> => api.get('/tenders/'),
+  getPage: (params: PageParams = {}): Promise<AxiosResponse<CursorPage<Tender>>> =>
+    api.get('/tenders/', { params: { page_size: 20, ...params } }),
+  getActive: (params: PageParams = {}): Promise<AxiosResponse<CursorPage<Tender>>> =>
+    api.get('/tenders/', { params: { page_size: 20, ...params, active: true } }),
   getById: (id: number): Promise<AxiosResponse<Tender>> => api.get(`/tenders/${id}/`),
   create: (data: Partial<Tender>): Promise<AxiosResponse<Tender>> => api.post('/tenders/', data),
   update: (id: number, data: Partial<Tender>): Promise<AxiosResponse<Tender>> => api.put(`/tenders/${id}/`, data),
   delete: (id: number): Promise<AxiosResponse> => api.delete(`/tenders/${id}/`),
+  bulkCreate: (items: Partial<Tender>[]): Promise<AxiosResponse<Tender[]>> => api.post('/tenders/bulk/', items),
+  bulkUpdate: (items: Partial<Tender>[]): Promise<AxiosResponse<Tender[]>> => api.patch('/tenders/bulk/', items),
+  bulkDelete: (ids: number[]): Promise<AxiosResponse<{ deleted: number }>> => api.delete('/tenders/bulk/', { data: { ids } }),
 };
 
 export const newsEventsAPI = {
-  getAll: (): Promise<AxiosResponse<NewsEvent[]>> => api.get('/news-events/'),
+  getPage: (params: PageParams = {}): Promise<AxiosResponse<CursorPage<NewsEvent>>> =>
+    api.get('/news-events/', { params: { page_size: 20, ...params } }),
   getById: (id: number): Promise<AxiosResponse<NewsEvent>> => api.get(`/news-events/${id}/`),
   create: (data: Partial<NewsEvent>): Promise<AxiosResponse<NewsEvent>> => api.post('/news-events/', data),
   update: (id: number, data: Partial<NewsEvent>): Promise<AxiosResponse<NewsEvent>> => api.put(`/news-events/${id}/`, data),
   delete: (id: number): Promise<AxiosResponse> => api.delete(`/news-events/${id}/`),
+  bulkCreate: (items: Partial<NewsEvent>[]): Promise<AxiosResponse<NewsEvent[]>> => api.post('/news-events/bulk/', items),
+  bulkUpdate: (items: Partial<NewsEvent>[]): Promise<AxiosResponse<NewsEvent[]>> => api.patch('/news-events/bulk/', items),
+  bulkDelete: (ids: number[]): Promise<AxiosResponse<{ deleted: number }>> => api.delete('/news-events/bulk/', { data: { ids } }),
 };
 
 export const galleryAPI = {
-  getAll: (): Promise<AxiosResponse<GalleryItem[]>> => api.get('/gallery/'),
+  getPage: (params: PageParams = {}): Promise<AxiosResponse<CursorPage<GalleryItem>>> =>
+    api.get('/gallery/', { params: { page_size: 20, ...params } }),
   getById: (id: number): Promise<AxiosResponse<GalleryItem>> => api.get(`/gallery/${id}/`),
   create: (data: Partial<GalleryItem>): Promise<AxiosResponse<GalleryItem>> => api.post('/gallery/', data),
   update: (id: number, data: Partial<GalleryItem>): Promise<AxiosResponse<GalleryItem>> => api.put(`/gallery/${id}/`, data),
   delete: (id: number): Promise<AxiosResponse> => api.delete(`/gallery/${id}/`),
+  bulkCreate: (items: Partial<GalleryItem>[]): Promise<AxiosResponse<GalleryItem[]>> => api.post('/gallery/bulk/', items),
+  bulkUpdate: (items: Partial<GalleryItem>[]): Promise<AxiosResponse<GalleryItem[]>> => api.patch('/gallery/bulk/', items),
+  bulkDelete: (ids: number[]): Promise<AxiosResponse<{ deleted: number }>> => api.delete('/gallery/bulk/', { data: { ids } }),
 };
 
 export const documentsAPI = {
-  getAll: (): Promise<AxiosResponse<Document[]>> => api.get('/documents/'),
+  getPage: (params: PageParams = {}): Promise<AxiosResponse<CursorPage<Document>>> =>
+    api.get('/documents/', { params: { page_size: 20, ...params } }),
   getById: (id: number): Promise<AxiosResponse<Document>> => api.get(`/documents/${id}/`),
   create: (data: Partial<Document>): Promise<AxiosResponse<Document>> => api.post('/documents/', data),
   update: (id: number, data: Partial<Document>): Promise<AxiosResponse<Document>> => api.put(`/documents/${id}/`, data),
   delete: (id: number): Promise<AxiosResponse> => api.delete(`/documents/${id}/`),
+  bulkCreate: (items: Partial<Document>[]): Promise<AxiosResponse<Document[]>> => api.post('/documents/bulk/', items),
+  bulkUpdate: (items: Partial<Document>[]): Promise<AxiosResponse<Document[]>> => api.patch('/documents/bulk/', items),
+  bulkDelete: (ids: number[]): Promise<AxiosResponse<{ deleted: number }>> => api.delete('/documents/bulk/', { data: { ids } }),
 };
 
 export const schemesProjectsAPI = {
-  getAll: (): Promise<AxiosResponse<SchemeProject[]>> => api.get('/schemes-projects/'),
+  getPage: (params: PageParams = {}): Promise<AxiosResponse<CursorPage<SchemeProject>>> =>
+    api.get('/schemes-projects/', { params: { page_size: 20, ...params } }),
   getById: (id: number): Promise<AxiosResponse<SchemeProject>> => api.get(`/schemes-projects/${id}/`),
   create: (data: Partial<SchemeProject>): Promise<AxiosResponse<SchemeProject>> => api.post('/schemes-projects/', data),
   update: (id: number, data: Partial<SchemeProject>): Promise<AxiosResponse<SchemeProject>> => api.put(`/schemes-projects/${id}/`, data),
   delete: (id: number): Promise<AxiosResponse> => api.delete(`/schemes-projects/${id}/`),
+  bulkCreate: (items: Partial<SchemeProject>[]): Promise<AxiosResponse<SchemeProject[]>> => api.post('/schemes-projects/bulk/', items),
+  bulkUpdate: (items: Partial<SchemeProject>[]): Promise<AxiosResponse<SchemeProject[]>> => api.patch('/schemes-projects/bulk/', items),
+  bulkDelete: (ids: number[]): Promise<AxiosResponse<{ deleted: number }>> => api.delete('/schemes-projects/bulk/', { data: { ids } }),
 };
 
 export const feedbackAPI = {
-  getAll: (): Promise<AxiosResponse<Feedback[]>> => api.get('/feedback/'),
+  getPage: (params: PageParams = {}): Promise<AxiosResponse<CursorPage<Feedback>>> =>
+    api.get('/feedback/', { params: { page_size: 20, ...params } }),
   getById: (id: number): Promise<AxiosResponse<Feedback>> => api.get(`/feedback/${id}/`),
   update: (id: number, data: Partial<Feedback>): Promise<AxiosResponse<Feedback>> => api.put(`/feedback/${id}/`, data),
   delete: (id: number): Promise<AxiosResponse> => api.delete(`/feedback/${id}/`),
+  export: (format: 'csv' | 'jsonl', params: { status?: string; submitted_date_after?: string; submitted_date_before?: string } = {}): Promise<AxiosResponse<Blob>> =>
+    api.get(`/feedback/export/${format}/`, { params, responseType: 'blob' }),
 };
 
 export const helplineQueriesAPI = {
-  getAll: (): Promise<AxiosResponse<HelplineQuery[]>> => api.get('/helpline-queries/'),
+  getPage: (params: PageParams = {}): Promise<AxiosResponse<CursorPage<HelplineQuery>>> =>
+    api.get('/helpline-queries/', { params: { page_size: 20, ...params } }),
   getById: (id: number): Promise<AxiosResponse<HelplineQuery>> => api.get(`/helpline-queries/${id}/`),
   update: (id: number, data: Partial<HelplineQuery>): Promise<AxiosResponse<HelplineQuery>> => api.put(`/helpline-queries/${id}/`, data),
   delete: (id: number): Promise<AxiosResponse> => api.delete(`/helpline-queries/${id}/`),
+  export: (format: 'csv' | 'jsonl', params: { assigned_to?: number; query_date_after?: string; query_date_before?: string } = {}): Promise<AxiosResponse<Blob>> =>
+    api.get(`/helpline-queries/export/${format}/`, { params, responseType: 'blob' }),
 };
 
+export const searchAPI = {
+  search: (q: string, params: { type?: string; page?: number; page_size?: number } = {}): Promise<AxiosResponse<SearchResults>> =>
+    api.get('/search/', { params: { q, ...params } }),
+};
+
+// Row counts for the admin dashboard.
+export const dashboardAPI = {
+  get: (): Promise<AxiosResponse<DashboardCounts>> => api.get('/dashboard/'),
+};
+
+// Latest rows of every homepage section in one request.
+export const homeAPI = {
+  get: (limit?: number): Promise<AxiosResponse<HomeContent>> => api.get('/home/', { params: { limit } }),
+};
+
+// Extracts the opaque cursor from a `next`/`previous` link so it can be passed back to getPage.
+export const cursorFromUrl = (url: string | null): string | undefined =>
+  url ? new URL(url).searchParams.get('cursor') ?? undefined : undefined;
+
 export default api;
\ No newline at end of file